@@ -1,4 +1,17 @@
-from typing import Set, Tuple
+from typing import Iterable, Optional, Set
+
+
+def cells_to_mask(cells: Iterable[int]) -> int:
+    """
+    Pack a collection of cells into a bitmask with one bit set per cell.
+
+    :param cells: Packed cell indices.
+    :return: Integer with bit n set for each cell n.
+    """
+    mask = 0
+    for cell in cells:
+        mask |= 1 << cell
+    return mask
 
 
 class KnowledgeStatement:
@@ -6,17 +19,38 @@ class KnowledgeStatement:
     Logical statement about a Minesweeper game.
     A knowledge statement consists of a set of board cells,
     and a count of the number of those cells which are mines.
+    Cells are packed integer indices (row * grid_size + col).
     """
 
-    def __init__(self, cell_positions: Set[Tuple[int, int]], mine_count: int):
+    def __init__(self, cell_positions: Set[int], mine_count: int):
         """
         Initialise a knowledge statement with given cells and count.
 
-        :param cell_positions: Set of cell coordinates.
+        :param cell_positions: Set of packed cell indices.
         :param mine_count: Number of mines in the set of cells.
         """
-        self.cell_positions: Set[Tuple[int, int]] = set(cell_positions)
+        self.cell_positions: Set[int] = set(cell_positions)
         self.mine_count: int = mine_count
+        # The same cells as a bitmask, kept in step with cell_positions, so subset and overlap
+        # tests between statements are a couple of integer operations instead of set scans
+        self.cell_mask: int = cells_to_mask(self.cell_positions)
+        # Hash is cached until the statement is next changed by mark_cell_as_mine / mark_cell_as_safe
+        self._hash_cache: Optional[int] = None
+        # Whether every cell is a mine ('mines'), no cell is a mine ('safes') or neither ('unknown'),
+        # recomputed only when the statement changes so known_mines / known_safes just read it
+        self._status: str = 'unknown'
+        self._update_status()
+
+    def _update_status(self) -> None:
+        """
+        Recompute whether the statement's cells are all known mines, all known safe, or undetermined.
+        """
+        if len(self.cell_positions) == self.mine_count:
+            self._status = 'mines'
+        elif self.mine_count == 0:
+            self._status = 'safes'
+        else:
+            self._status = 'unknown'
 
     def __eq__(self, other: object) -> bool:
         """
@@ -26,7 +60,7 @@ class KnowledgeStatement:
         :return: True if objects are equal, False otherwise.
         """
         if isinstance(other, KnowledgeStatement):
-            return self.cell_positions == other.cell_positions and self.mine_count == other.mine_count
+            return self.cell_mask == other.cell_mask and self.mine_count == other.mine_count
         return False
 
     def __hash__(self) -> int:
@@ -35,7 +69,9 @@ class KnowledgeStatement:
 
         :return: Hash value as an integer.
         """
-        return hash((frozenset(self.cell_positions), self.mine_count))
+        if self._hash_cache is None:
+            self._hash_cache = hash((frozenset(self.cell_positions), self.mine_count))
+        return self._hash_cache
 
     def __lt__(self, other: object) -> bool:
         """
@@ -56,46 +92,81 @@ class KnowledgeStatement:
         """
         return f"{self.cell_positions} = {self.mine_count}"
 
-    def known_mines(self) -> Set[Tuple[int, int]]:
+    def known_mines(self) -> Set[int]:
         """
         Return the set of all cells known to be mines.
 
-        :return: Set of cell coordinates known to be mines.
+        :return: Set of packed cell indices known to be mines.
         """
-        if len(self.cell_positions) == self.mine_count:
+        if self._status == 'mines':
             return self.cell_positions
         return set()
 
-    def known_safes(self) -> Set[Tuple[int, int]]:
+    def known_safes(self) -> Set[int]:
         """
         Return the set of all cells in self.cell_positions known to be safe.
 
-        :return: Set of cell coordinates known to be safe.
+        :return: Set of packed cell indices known to be safe.
         """
-        if self.mine_count == 0:
+        if self._status == 'safes':
             return self.cell_positions
         return set()
 
-    def mark_cell_as_mine(self, cell: Tuple[int, int]) -> None:
+    def mark_cell_as_mine(self, cell: int) -> None:
         """
         Update internal knowledge representation given that
         a cell is known to be a mine.
 
-        :param cell: Tuple representing the cell coordinates.
+        :param cell: The packed cell index.
         """
         if cell in self.cell_positions:
             self.cell_positions.remove(cell)
+            self.cell_mask &= ~(1 << cell)
             self.mine_count -= 1
+            self._hash_cache = None
+            self._update_status()
 
-    def mark_cell_as_safe(self, cell: Tuple[int, int]) -> None:
+    def mark_cell_as_safe(self, cell: int) -> None:
         """
         Update internal knowledge representation given that
         a cell is known to be safe.
 
-        :param cell: Tuple representing the cell coordinates.
+        :param cell: The packed cell index.
         """
         if cell in self.cell_positions:
             self.cell_positions.remove(cell)
+            self.cell_mask &= ~(1 << cell)
+            self._hash_cache = None
+            self._update_status()
+
+    def mark_cells_as_mine(self, cells: Set[int]) -> None:
+        """
+        Update internal knowledge representation given that
+        a batch of cells are known to be mines.
+
+        :param cells: Set of packed cell indices.
+        """
+        overlap = self.cell_positions & cells
+        if overlap:
+            self.cell_positions -= overlap
+            self.cell_mask &= ~cells_to_mask(overlap)
+            self.mine_count -= len(overlap)
+            self._hash_cache = None
+            self._update_status()
+
+    def mark_cells_as_safe(self, cells: Set[int]) -> None:
+        """
+        Update internal knowledge representation given that
+        a batch of cells are known to be safe.
+
+        :param cells: Set of packed cell indices.
+        """
+        overlap = self.cell_positions & cells
+        if overlap:
+            self.cell_positions -= overlap
+            self.cell_mask &= ~cells_to_mask(overlap)
+            self._hash_cache = None
+            self._update_status()
 
     def get_mine_count(self) -> int:
         """
@@ -105,10 +176,10 @@ class KnowledgeStatement:
         """
         return self.mine_count
 
-    def get_cell_positions(self) -> Set[Tuple[int, int]]:
+    def get_cell_positions(self) -> Set[int]:
         """
         Get the set of cell positions in the knowledge statement.
 
-        :return: Set of tuples representing cell positions.
+        :return: Set of packed cell indices.
         """
         return self.cell_positions
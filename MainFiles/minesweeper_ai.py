@@ -1,5 +1,5 @@
 from collections import deque
-from typing import List, Set, Tuple, Union, Deque
+from typing import Dict, FrozenSet, List, Set, Tuple, Union, Deque
 import random
 from .knowledge_statement import KnowledgeStatement
 from .stat_generator import StatGenerator
@@ -21,11 +21,22 @@ class MinesweeperAI:
         :param safe_cell_strategy: Strategy to use for selecting safe cells.
         """
         self.grid_size: int = grid_size
-        self.moves_made: Set[Tuple[int, int]] = set()
-        self.identified_mines: Set[Tuple[int, int]] = set()
-        self.identified_safe_cells: Set[Tuple[int, int]] = set()
-        self.safe_cell_queue: Deque[Tuple[int, int]] = deque()
+        # Cells are tracked internally as packed integers (row * grid_size + col), see pack_cell
+        self.moves_made: Set[int] = set()
+        self.identified_mines: Set[int] = set()
+        # Every cell ever identified as safe. The queue gets each cell once, when it is first found safe,
+        # so it can still hold cells that have since been played, such as the cell just played or a clicked cell
+        self.identified_safe_cells: Set[int] = set()
+        self.safe_cell_queue: Deque[int] = deque()
         self.knowledge_base: List[KnowledgeStatement] = []
+        # Inverted index from each cell to the statements that mention it, so marking a cell
+        # only visits the statements containing it rather than the whole knowledge base
+        self._cell_to_statements: Dict[int, List[KnowledgeStatement]] = {}
+        # Statements that are new or have changed since they were last checked for known mines/safes
+        self._changed_statements: List[KnowledgeStatement] = []
+        self._neighbours: List[FrozenSet[int]] = self._build_neighbour_table()
+        # Neighbours of each cell not yet identified as safe, kept up to date as cells are marked safe
+        self._neighbours_not_known_safe: List[Set[int]] = [set(neighbours) for neighbours in self._neighbours]
         self.stat_generator = StatGenerator(self.grid_size)
         self.low_risk_cache: Set[Tuple[int, int]] = set()
 
@@ -36,15 +47,67 @@ class MinesweeperAI:
         self.safe_cell_data_structures = SafeCellDataStructures()
         self.safe_cell_selection_strategy = self.safe_cell_data_structures.select_strategy(safe_cell_strategy)
 
+    def pack_cell(self, cell: Tuple[int, int]) -> int:
+        """
+        Pack a (row, col) cell into a single integer index.
+
+        :param cell: Tuple representing the cell coordinates.
+        :return: The packed cell index, row * grid_size + col.
+        """
+        return cell[0] * self.grid_size + cell[1]
+
+    def unpack_cell(self, packed_cell: int) -> Tuple[int, int]:
+        """
+        Unpack an integer cell index back into (row, col) coordinates.
+
+        :param packed_cell: The packed cell index.
+        :return: Tuple representing the cell coordinates.
+        """
+        return divmod(packed_cell, self.grid_size)
+
+    def _build_neighbour_table(self) -> List[FrozenSet[int]]:
+        """
+        Build a table of the surrounding cells for every cell on the board, indexed by packed cell.
+
+        :return: A list where each entry is the frozenset of packed cells surrounding that cell.
+        """
+        neighbours: List[FrozenSet[int]] = []
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                neighbours.append(frozenset(
+                    i * self.grid_size + j
+                    for i in range(max(0, row - 1), min(self.grid_size, row + 2))
+                    for j in range(max(0, col - 1), min(self.grid_size, col + 2))
+                    if (i, j) != (row, col)
+                ))
+        return neighbours
+
+    def get_identified_mines(self) -> Set[Tuple[int, int]]:
+        """
+        Get the cells identified as mines as board coordinates.
+
+        :return: Set of tuples representing the identified mine positions.
+        """
+        return {self.unpack_cell(mine) for mine in self.identified_mines}
+
     def mark_cell_as_mine(self, cell: Tuple[int, int]) -> None:
         """
         Mark a cell as a mine and update the knowledge base accordingly.
 
         :param cell: Tuple representing the cell coordinates.
         """
+        self._mark_packed_cell_as_mine(self.pack_cell(cell))
+
+    def _mark_packed_cell_as_mine(self, cell: int) -> None:
+        """
+        Mark a packed cell as a mine and update the knowledge base accordingly.
+
+        :param cell: The packed cell index.
+        """
         self.identified_mines.add(cell)
-        for statement in self.knowledge_base:
+        for statement in self._cell_to_statements.pop(cell, ()):
             statement.mark_cell_as_mine(cell)
+            self._changed_statements.append(statement)
 
     def mark_cell_as_safe(self, cell: Tuple[int, int]) -> None:
         """
@@ -52,33 +115,117 @@ class MinesweeperAI:
 
         :param cell: Tuple representing the cell coordinates.
         """
+        self._mark_packed_cell_as_safe(self.pack_cell(cell))
+
+    def _mark_packed_cell_as_safe(self, cell: int) -> None:
+        """
+        Mark a packed cell as safe and update the knowledge base accordingly.
+
+        :param cell: The packed cell index.
+        """
         if cell not in self.identified_safe_cells:
             self.identified_safe_cells.add(cell)
             self.safe_cell_queue.append(cell)
-        for statement in self.knowledge_base:
+            for neighbour in self._neighbours[cell]:
+                self._neighbours_not_known_safe[neighbour].discard(cell)
+        for statement in self._cell_to_statements.pop(cell, ()):
             statement.mark_cell_as_safe(cell)
+            self._changed_statements.append(statement)
+
+    def _statements_containing(self, cells: Set[int]) -> List[KnowledgeStatement]:
+        """
+        Remove a batch of cells from the inverted index and collect the statements that mention them.
+        A statement containing several of the cells is only returned once.
+
+        :param cells: Set of packed cell indices.
+        :return: List of the affected KnowledgeStatements.
+        """
+        affected_statements: Dict[int, KnowledgeStatement] = {}
+        for cell in cells:
+            for statement in self._cell_to_statements.pop(cell, ()):
+                affected_statements[id(statement)] = statement
+        return list(affected_statements.values())
+
+    def _mark_packed_cells_as_mine(self, cells: Set[int]) -> None:
+        """
+        Mark a batch of packed cells as mines, updating each affected statement once.
+
+        :param cells: Set of packed cell indices.
+        """
+        self.identified_mines |= cells
+        for statement in self._statements_containing(cells):
+            statement.mark_cells_as_mine(cells)
+            self._changed_statements.append(statement)
+
+    def _mark_packed_cells_as_safe(self, cells: Set[int]) -> None:
+        """
+        Mark a batch of packed cells as safe, updating each affected statement once.
+
+        :param cells: Set of packed cell indices.
+        """
+        for cell in cells:
+            if cell not in self.identified_safe_cells:
+                self.identified_safe_cells.add(cell)
+                self.safe_cell_queue.append(cell)
+                for neighbour in self._neighbours[cell]:
+                    self._neighbours_not_known_safe[neighbour].discard(cell)
+        for statement in self._statements_containing(cells):
+            statement.mark_cells_as_safe(cells)
+            self._changed_statements.append(statement)
+
+    def _index_statement(self, statement: KnowledgeStatement) -> None:
+        """
+        Register a statement under each of its cells in the inverted index
+        and queue it to be checked for known mines and safe cells.
+
+        :param statement: The KnowledgeStatement being added to the knowledge base.
+        """
+        for cell in statement.get_cell_positions():
+            self._cell_to_statements.setdefault(cell, []).append(statement)
+        self._changed_statements.append(statement)
+
+    def _unindex_statement(self, statement: KnowledgeStatement) -> None:
+        """
+        Remove one registration of a statement from the inverted index under each of its cells.
+        Entries are matched by identity, as an equal statement, or the same one added again, may be indexed under the same cells.
+
+        :param statement: The KnowledgeStatement being removed from the knowledge base.
+        """
+        for cell in statement.get_cell_positions():
+            indexed_statements = self._cell_to_statements.get(cell, ())
+            for i, indexed_statement in enumerate(indexed_statements):
+                if indexed_statement is statement:
+                    del indexed_statements[i]
+                    break
 
     def remove_empty_and_duplicate_statements(self) -> None:
         """
         Remove empty and duplicate knowledge statements from the knowledge base.
         """
-        original_set = set(self.knowledge_base)
-        cleaned_knowledge_base = []
-        duplicate_count = 0
+        seen_statements: Set[KnowledgeStatement] = set()
+        duplicate_statements: List[KnowledgeStatement] = []
 
+        # Compact the list in place rather than building a new one on every pass of the add_knowledge loop
+        kept_count = 0
         for statement in self.knowledge_base:
             if statement.get_cell_positions():
-                if statement not in original_set:
-                    duplicate_count += 1
+                if statement in seen_statements:
+                    duplicate_statements.append(statement)
                 else:
-                    cleaned_knowledge_base.append(statement)
-                    original_set.remove(statement)
+                    self.knowledge_base[kept_count] = statement
+                    kept_count += 1
+                    seen_statements.add(statement)
+        del self.knowledge_base[kept_count:]
+
+        # A dropped duplicate would otherwise stay in the index and keep being updated and rechecked.
+        # Empty statements need no unindexing, as each cell leaves the index when it is marked
+        for statement in duplicate_statements:
+            self._unindex_statement(statement)
 
-        self.knowledge_base = cleaned_knowledge_base
         cleaned_size = len(self.knowledge_base)
 
         self.stat_generator.update_knowledge_base_size(cleaned_size)
-        self.stat_generator.update_duplicate_inferences(duplicate_count)
+        self.stat_generator.update_duplicate_inferences(len(duplicate_statements))
 
     def add_knowledge(self, cell: Tuple[int, int], surrounding_mines_count: int) -> None:
         """
@@ -89,25 +236,20 @@ class MinesweeperAI:
         """
         self.stat_generator.reset_current_stats()
 
-        self.moves_made.add(cell)
-        self.mark_cell_as_safe(cell)
+        packed_cell: int = self.pack_cell(cell)
+        self.moves_made.add(packed_cell)
+        self._mark_packed_cell_as_safe(packed_cell)
 
-        surrounding_cells: Set[Tuple[int, int]] = set(
-            (i, j)
-            for i in range(cell[0] - 1, cell[0] + 2)
-            for j in range(cell[1] - 1, cell[1] + 2)
-            if (i, j) != cell and 0 <= i < self.grid_size and 0 <= j < self.grid_size
-        )
-
-        surrounding_cells.difference_update(self.identified_safe_cells)
-        for mine in self.identified_mines:
-            if mine in surrounding_cells:
-                surrounding_mines_count -= 1
-                surrounding_cells.remove(mine)
+        surrounding_cells: Set[int] = self._neighbours_not_known_safe[packed_cell]
+        # Intersect from the side of the (at most 8) surrounding cells, not the full set of identified mines
+        known_surrounding_mines: Set[int] = surrounding_cells & self.identified_mines
+        surrounding_mines_count -= len(known_surrounding_mines)
+        surrounding_cells = surrounding_cells - known_surrounding_mines
 
         if surrounding_cells:
             new_statement = KnowledgeStatement(surrounding_cells, surrounding_mines_count)
             self.knowledge_base.append(new_statement)
+            self._index_statement(new_statement)
 
 
         knowledge_changed = True
@@ -118,10 +260,15 @@ class MinesweeperAI:
             loop_iterations += 1
             knowledge_changed = False
 
-            cells_to_mark_safe: Set[Tuple[int, int]] = set()
-            cells_to_mark_as_mine: Set[Tuple[int, int]] = set()
+            cells_to_mark_safe: Set[int] = set()
+            cells_to_mark_as_mine: Set[int] = set()
+
+            # Only statements that are new or were changed by the last round of marking can yield
+            # new known mines or safe cells, so the rest of the knowledge base is not rescanned
+            changed_statements = self._changed_statements
+            self._changed_statements = []
 
-            for statement in self.knowledge_base.copy():
+            for statement in changed_statements:
                 safe_cells = statement.known_safes()
                 mine_cells = statement.known_mines()
 
@@ -131,20 +278,24 @@ class MinesweeperAI:
             if cells_to_mark_safe or cells_to_mark_as_mine:
                 knowledge_changed = True
 
-            for safe_cell in cells_to_mark_safe:
-                self.mark_cell_as_safe(safe_cell)
-            for mine_cell in cells_to_mark_as_mine:
-                self.mark_cell_as_mine(mine_cell)
+            # Each affected statement is updated once per batch rather than once per resolved cell
+            if cells_to_mark_safe:
+                self._mark_packed_cells_as_safe(cells_to_mark_safe)
+            if cells_to_mark_as_mine:
+                self._mark_packed_cells_as_mine(cells_to_mark_as_mine)
 
             self.remove_empty_and_duplicate_statements()
 
             #  The knowledge base is sent to the user selected search algorithm and processed
             inferred_statements = self.search_algorithm_method(self.knowledge_base)
 
-            new_inferences = [inf for inf in inferred_statements if inf not in inferred_set]
+            # Set difference runs the membership tests in C, using the statements' cached hashes
+            new_inferences: Set[KnowledgeStatement] = set(inferred_statements) - inferred_set
             if new_inferences:
                 inferred_set.update(new_inferences)
                 self.knowledge_base.extend(new_inferences)
+                for inference in new_inferences:
+                    self._index_statement(inference)
                 knowledge_changed = True
 
         self.stat_generator.update_iterations(loop_iterations)
@@ -156,23 +307,41 @@ class MinesweeperAI:
         :return: Tuple representing the cell coordinates, or None if no safe move is possible.
         """
         if self.safe_cell_queue:
-            return self.safe_cell_selection_strategy(self.safe_cell_queue)
+            return self.unpack_cell(self.safe_cell_selection_strategy(self.safe_cell_queue))
         return None
 
+    def pick_move(self) -> Union[Tuple[int, int], None]:
+        """
+        Pick the AI's next move, a known safe cell if there is one, otherwise a random unmarked cell.
+        Queued safe cells that have already been played are passed over, so the move is never one already made.
+
+        :return: Tuple representing the cell coordinates, or None if no move is possible.
+        """
+        move = self.make_safe_move()
+        while move is not None and self.pack_cell(move) in self.moves_made:
+            move = self.make_safe_move()
+        return move if move is not None else self.make_random_move()
+
     def make_random_move(self) -> Union[Tuple[int, int], None]:
         """
         Make a random move by selecting an unmarked cell.
 
         :return: Tuple representing the cell coordinates, or None if no move is possible.
         """
-        all_possible_moves: List[Tuple[int, int]] = [
-            (i, j) for i in range(self.grid_size) for j in range(self.grid_size)
-        ]
-        move_found: bool = False
+        total_cells: int = self.grid_size * self.grid_size
 
-        while not move_found and all_possible_moves:
-            random_cell_index: int = random.randrange(len(all_possible_moves))
-            selected_cell: Tuple[int, int] = all_possible_moves.pop(random_cell_index)
+        # Most of the board is usually still open, so a few direct random picks nearly always land
+        # on a valid cell without building a list of every cell on the board
+        for _ in range(20):
+            selected_cell: int = random.randrange(total_cells)
             if selected_cell not in self.moves_made and selected_cell not in self.identified_mines:
-                return selected_cell
+                return self.unpack_cell(selected_cell)
+
+        # Late in the game valid cells are scarce, so fall back to choosing from the ones left
+        remaining_moves: List[int] = [
+            cell for cell in range(total_cells)
+            if cell not in self.moves_made and cell not in self.identified_mines
+        ]
+        if remaining_moves:
+            return self.unpack_cell(random.choice(remaining_moves))
         return None
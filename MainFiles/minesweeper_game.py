@@ -34,12 +34,17 @@ class MinesweeperGame:
 
         self.flagged_mine_positions: Set[Tuple[int, int]] = set()
         self.game_over: bool = False
+        # Set once the game is won, after which no move can change the result
+        self._game_won: bool = False
 
         if not existing_board:
             self._randomly_place_mines()
         else:
             self._load_existing_mines()
 
+        # The mine layout is fixed from here on, so adjacency counts only need computing once
+        self._adjacent_mine_counts: List[List[int]] = self._calculate_adjacent_mine_counts()
+
         # Colours
         self._font_colour: Tuple[int, int, int] = (255, 255, 255)  # white
         self._cell_colour: Tuple[int, int, int] = (34, 86, 117)
@@ -48,7 +53,7 @@ class MinesweeperGame:
 
         # Board font:
         font_path: str = "MainFiles/assets/fonts/Cronus_Round.otf"
-        self._small_font: pygame.font.Font = pygame.font.Font(font_path, 20)
+        # The small font used for cell numbers is sized to the cells in _calculate_board_dimensions
         self._medium_font: pygame.font.Font = pygame.font.Font(font_path, 28)
         self._large_font: pygame.font.Font = pygame.font.Font(font_path, 40)
 
@@ -66,14 +71,24 @@ class MinesweeperGame:
         # Load images
         self._load_and_scale_images()
 
+        # Board rendering: the empty grid is drawn once, then only cells whose state changed are redrawn
+        self._cell_rectangles: List[List[pygame.Rect]] = self._build_cell_rectangles()
+        self._static_board_surface: pygame.Surface = self._render_static_board()
+        self._dirty_cells: Set[Tuple[int, int]] = set()
+        self._full_board_redraw_needed: bool = True
+        self._game_over_drawn: bool = False
+
     def _randomly_place_mines(self) -> None:
         """Randomly places mines on the board. Will not place a mine at the starting cell position"""
-        while len(self.mine_positions) < self._mine_count:
-            row: int = random.randrange(self._grid_size)
-            col: int = random.randrange(self._grid_size)
-            if (row, col) != self.starting_position and not self.board[row][col]:
-                self.mine_positions.add((row, col))
-                self.board[row][col] = True
+        start_index: int = self.starting_position[0] * self._grid_size + self.starting_position[1]
+        # Draw distinct cells from every cell but the start in one call, rather than rejection sampling;
+        # indices at or past the start cell are shifted up by one to skip over it
+        for mine_index in random.sample(range(self._grid_size * self._grid_size - 1), self._mine_count):
+            if mine_index >= start_index:
+                mine_index += 1
+            row, col = divmod(mine_index, self._grid_size)
+            self.mine_positions.add((row, col))
+            self.board[row][col] = True
 
     def _load_existing_mines(self) -> None:
         """Loads mine positions from the existing board layout."""
@@ -82,6 +97,23 @@ class MinesweeperGame:
                 if self.board[row][col]:
                     self.mine_positions.add((row, col))
 
+    def _calculate_adjacent_mine_counts(self) -> List[List[int]]:
+        """
+        Build a table of adjacent mine counts for every cell on the board.
+        Each mine increments its neighbours, so the work scales with the mine count rather than the board size.
+
+        :return: A 2D list where each entry is the number of mines adjacent to that cell.
+        """
+        adjacent_mine_counts: List[List[int]] = [[0] * self._grid_size for _ in range(self._grid_size)]
+        for mine_row, mine_col in self.mine_positions:
+            for row in range(max(0, mine_row - 1), min(self._grid_size, mine_row + 2)):
+                count_row: List[int] = adjacent_mine_counts[row]
+                for col in range(max(0, mine_col - 1), min(self._grid_size, mine_col + 2)):
+                    count_row[col] += 1
+            # A mine is not adjacent to itself
+            adjacent_mine_counts[mine_row][mine_col] -= 1
+        return adjacent_mine_counts
+
     def save_board_layout(self) -> List[List[bool]]:
         """
         Save the current board layout.
@@ -128,17 +160,48 @@ class MinesweeperGame:
         :param cell_position: Tuple representing the cell coordinates.
         :return: The number of adjacent mines.
         """
-        adjacent_mines: int = 0
-        for row in range(max(0, cell_position[0] - 1), min(self._grid_size, cell_position[0] + 2)):
-            for col in range(max(0, cell_position[1] - 1), min(self._grid_size, cell_position[1] + 2)):
-                if (row, col) != cell_position and self.board[row][col]:
-                    adjacent_mines += 1
-        return adjacent_mines
+        row, col = cell_position
+        return self._adjacent_mine_counts[row][col]
+
+    def reveal_cell(self, cell_position: Tuple[int, int]) -> None:
+        """
+        Mark a cell as revealed so that it is redrawn with its adjacent mine count.
+
+        :param cell_position: Tuple representing the cell coordinates.
+        """
+        self.revealed_positions.add(cell_position)
+        self._dirty_cells.add(cell_position)
+
+    def flag_mine(self, cell_position: Tuple[int, int]) -> None:
+        """
+        Flag a cell as a mine so that it is redrawn with a flag.
+
+        :param cell_position: Tuple representing the cell coordinates.
+        """
+        self.flagged_mine_positions.add(cell_position)
+        self._dirty_cells.add(cell_position)
+
+    def flag_mines(self, cell_positions: Set[Tuple[int, int]]) -> None:
+        """
+        Flag a batch of cells as mines, redrawing only those not already flagged.
+
+        :param cell_positions: Set of tuples representing the cell coordinates.
+        """
+        newly_flagged = cell_positions - self.flagged_mine_positions
+        self.flagged_mine_positions |= newly_flagged
+        self._dirty_cells |= newly_flagged
 
     def is_game_won(self) -> bool:
         """Check if the game is won."""
-        all_safe_cells_revealed = len(self.revealed_positions) == (self._grid_size * self._grid_size - self._mine_count)
-        return self.flagged_mine_positions == self.mine_positions and all_safe_cells_revealed
+        if self._game_won:
+            return True
+        # Compare counts before comparing the flagged and mine sets element by element
+        if len(self.revealed_positions) != self._grid_size * self._grid_size - self._mine_count:
+            return False
+        if len(self.flagged_mine_positions) != len(self.mine_positions):
+            return False
+        self._game_won = self.flagged_mine_positions == self.mine_positions
+        return self._game_won
 
     def _calculate_board_dimensions(self) -> None:
         """Compute the size of the cells and their positions on the screen."""
@@ -153,57 +216,111 @@ class MinesweeperGame:
         # Dynamic font size based on cell size
         font_size: int = max(12, int(self._cell_size * 0.8))
         self._small_font: pygame.font.Font = pygame.font.Font("MainFiles/assets/fonts/Cronus_Round.otf", font_size)
+        # A cell can only ever show 0-8, so render each digit once rather than every frame
+        self._digit_surfaces: List[pygame.Surface] = [
+            self._small_font.render(str(digit), True, self._font_colour).convert_alpha() for digit in range(9)
+        ]
+        self._digit_rects: List[pygame.Rect] = [digit_surface.get_rect() for digit_surface in self._digit_surfaces]
 
     def _load_and_scale_images(self) -> None:
-        """Load and scale the images for flags and mines."""
+        """Load and scale the images for flags and mines, converted to the display's pixel format."""
         self._flag_image: pygame.Surface = pygame.image.load("MainFiles/assets/images/flag.png")
-        self._flag_image = pygame.transform.scale(self._flag_image, (self._cell_size // 2, self._cell_size // 2))
+        self._flag_image = pygame.transform.scale(self._flag_image,
+                                                  (self._cell_size // 2, self._cell_size // 2)).convert_alpha()
         self._mine_image: pygame.Surface = pygame.image.load("MainFiles/assets/images/mine.png")
-        self._mine_image = pygame.transform.scale(self._mine_image, (self._cell_size // 2, self._cell_size // 2))
+        self._mine_image = pygame.transform.scale(self._mine_image,
+                                                  (self._cell_size // 2, self._cell_size // 2)).convert_alpha()
 
-    def draw_game_board(self) -> List[List[pygame.Rect]]:
+    def _build_cell_rectangles(self) -> List[List[pygame.Rect]]:
         """
-        Draw the game board on the screen.
+        Build the screen rects for every cell on the board.
 
         :return: A 2D list of pygame.Rect objects representing the cells.
         """
-        cell_rectangles: List[List[pygame.Rect]] = []
-        for row in range(self._grid_size):
-            row_rects: List[pygame.Rect] = []
-            for col in range(self._grid_size):
-                cell_rect = pygame.Rect(
+        return [
+            [
+                pygame.Rect(
                     self._board_origin_x + col * self._cell_size,
                     self._board_origin_y + row * self._cell_size,
                     self._cell_size, self._cell_size
                 )
-                pygame.draw.rect(self._screen, self._cell_colour, cell_rect)
-                pygame.draw.rect(self._screen, self._border_colour, cell_rect, 3)
-
-                image_x: int = cell_rect.x + (self._cell_size - self._flag_image.get_width()) // 2
-                image_y: int = cell_rect.y + (self._cell_size - self._flag_image.get_height()) // 2
-
-                if self.contains_mine((row, col)) and self.game_over:
-                    self._screen.blit(self._mine_image, (image_x, image_y))
-                elif (row, col) in self.flagged_mine_positions:
-                    self._screen.blit(self._flag_image, (image_x, image_y))
-                elif (row, col) in self.revealed_positions:
-                    adjacent_mines_text = self._small_font.render(
-                        str(self.count_adjacent_mines((row, col))),
-                        True, self._font_colour
-                    )
-                    text_rect = adjacent_mines_text.get_rect()
-                    text_rect.center = cell_rect.center
-                    self._screen.blit(adjacent_mines_text, text_rect)
-
-                row_rects.append(cell_rect)
-            cell_rectangles.append(row_rects)
-        return cell_rectangles
-
-    def refresh_game_screen(self) -> None:
-        """Fill the screen with the background colour and redraw the board."""
-        self._screen.fill(self._background_colour)
-        self.draw_game_board()
-        pygame.display.flip()
+                for col in range(self._grid_size)
+            ]
+            for row in range(self._grid_size)
+        ]
+
+    def _render_static_board(self) -> pygame.Surface:
+        """
+        Render the empty grid of cells and borders onto a surface the size of the board.
+
+        :return: A surface holding the board with no flags, mines or numbers drawn.
+        """
+        board_size: int = self._cell_size * self._grid_size
+        static_board_surface = pygame.Surface((board_size, board_size))
+        for row in range(self._grid_size):
+            for col in range(self._grid_size):
+                cell_rect = pygame.Rect(col * self._cell_size, row * self._cell_size, self._cell_size, self._cell_size)
+                pygame.draw.rect(static_board_surface, self._cell_colour, cell_rect)
+                pygame.draw.rect(static_board_surface, self._border_colour, cell_rect, 3)
+        # Match the display's pixel format so the board is copied as-is on every full redraw
+        return static_board_surface.convert()
+
+    def _draw_cell_contents(self, cell_position: Tuple[int, int]) -> None:
+        """
+        Draw the mine, flag or adjacent mine count of a cell, if it has one.
+
+        :param cell_position: Tuple representing the cell coordinates.
+        """
+        row, col = cell_position
+        cell_rect: pygame.Rect = self._cell_rectangles[row][col]
+
+        image_x: int = cell_rect.x + (self._cell_size - self._flag_image.get_width()) // 2
+        image_y: int = cell_rect.y + (self._cell_size - self._flag_image.get_height()) // 2
+
+        if self.game_over and self.board[row][col]:
+            self._screen.blit(self._mine_image, (image_x, image_y))
+        elif cell_position in self.flagged_mine_positions:
+            self._screen.blit(self._flag_image, (image_x, image_y))
+        elif cell_position in self.revealed_positions:
+            adjacent_mines_count: int = self._adjacent_mine_counts[row][col]
+            text_rect: pygame.Rect = self._digit_rects[adjacent_mines_count].copy()
+            text_rect.center = cell_rect.center
+            self._screen.blit(self._digit_surfaces[adjacent_mines_count], text_rect)
+
+    def draw_game_board(self) -> List[pygame.Rect]:
+        """
+        Draw the game board on the screen.
+        The whole board is drawn the first time; after that only cells changed through
+        reveal_cell, flag_mine or the game ending are redrawn.
+
+        :return: The areas of the screen that were drawn, for passing to pygame.display.update.
+        """
+        if self.game_over and not self._game_over_drawn:
+            # Every mine is uncovered when the game ends
+            self._dirty_cells.update(self.mine_positions)
+            self._game_over_drawn = True
+
+        if self._full_board_redraw_needed:
+            self._screen.blit(self._static_board_surface, (self._board_origin_x, self._board_origin_y))
+            cells_to_draw = self.revealed_positions | self.flagged_mine_positions
+            if self.game_over:
+                cells_to_draw |= self.mine_positions
+            self._full_board_redraw_needed = False
+            drawn_rects = [self._static_board_surface.get_rect(topleft=(self._board_origin_x, self._board_origin_y))]
+        else:
+            # Restore the empty cell from the static board before drawing its new contents over it
+            for row, col in self._dirty_cells:
+                cell_rect: pygame.Rect = self._cell_rectangles[row][col]
+                self._screen.blit(self._static_board_surface, cell_rect,
+                                  cell_rect.move(-self._board_origin_x, -self._board_origin_y))
+            cells_to_draw = self._dirty_cells
+            drawn_rects = [self._cell_rectangles[row][col] for row, col in cells_to_draw]
+
+        for cell_position in cells_to_draw:
+            self._draw_cell_contents(cell_position)
+        self._dirty_cells = set()
+
+        return drawn_rects
 
     # Getter methods
     def get_grid_size(self) -> int:
@@ -218,6 +335,10 @@ class MinesweeperGame:
         """Return the AI move speed."""
         return self._ai_move_speed
 
+    def get_cell_rectangles(self) -> List[List[pygame.Rect]]:
+        """Return the screen rects of the board cells, indexed by row then column."""
+        return self._cell_rectangles
+
     def get_screen(self) -> pygame.Surface:
         """Return the Pygame screen surface."""
         return self._screen
@@ -1,8 +1,83 @@
 import pygame
-from typing import List, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from .user_input_handler import UserInputHandler
 
 
+def _convert_for_display(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a surface to the pixel format of the display, so blitting it does not convert it on every frame.
+    Surfaces with per-pixel alpha keep it. Returns the surface unchanged if no display mode has been set yet.
+    :param surface: The surface to convert.
+    :return: The converted surface.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+@lru_cache(maxsize=32)
+def _load_font_cached(font_path: str, font_size: int) -> pygame.font.Font:
+    """
+    Loads a font from disk, reusing the Font object for any path and size already loaded.
+    :param font_path: The path of the font file.
+    :param font_size: The size of the font to load.
+    :return: A pygame Font object.
+    """
+    return pygame.font.Font(font_path, font_size)
+
+
+@lru_cache(maxsize=32)
+def _build_rounded_rect_surface(width: int, height: int, colour: Tuple[int, int, int],
+                                radius: float) -> pygame.Surface:
+    """
+    Builds a transparent surface holding a rectangle with rounded corners, shared by every caller of the same
+    size, colour and radius.
+    :param width: The width of the rectangle.
+    :param height: The height of the rectangle.
+    :param colour: The colour of the rectangle.
+    :param radius: The radius of the corners as a fraction of the shorter side.
+    :return: The rounded rectangle surface.
+    """
+    corner_radius = min(width, height) * radius  # Adjust the corner radius
+
+    rounded_rect_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(rounded_rect_surface, colour, rounded_rect_surface.get_rect(), border_radius=int(corner_radius))
+    return _convert_for_display(rounded_rect_surface)
+
+
+class Button:
+    """
+    Represents a button drawn by the UI: its rect, background and current label.
+    """
+
+    # Buttons are read on every frame the menu or game controls are drawn, slots make those accesses direct
+    __slots__ = ('rect', 'text', 'text_rect', 'background', 'button_colour', 'state', 'action')
+
+    def __init__(self, rect: pygame.Rect, text: pygame.Surface, text_rect: pygame.Rect, background: pygame.Surface,
+                 button_colour: Tuple[int, int, int], state: str) -> None:
+        """
+        Initialise a Button.
+
+        :param rect: The area of the screen the button covers.
+        :param text: The rendered label of the button.
+        :param text_rect: Where the label is drawn, centred on the button.
+        :param background: The rounded rectangle drawn behind the label.
+        :param button_colour: The background color of the button.
+        :param state: The initial state (text) of the button.
+        """
+        self.rect: pygame.Rect = rect
+        self.text: pygame.Surface = text
+        self.text_rect: pygame.Rect = text_rect
+        self.background: pygame.Surface = background
+        self.button_colour: Tuple[int, int, int] = button_colour
+        self.state: str = state
+        self.action = None  # Placeholder for future button action if needed
+
+
 class MinesweeperUI:
     """
     Handles the user interface elements of the Minesweeper game, including buttons, labels, and input boxes.
@@ -18,7 +93,12 @@ class MinesweeperUI:
         self.game = game
         self.error_message: str = ""
         self.options_menu_open: bool = True
+        # Areas of the screen the options menu redrew on its last frame, or None when the whole menu
+        # still has to be pushed to the display, on startup and whenever the menu is reopened
+        self._menu_dirty_rects: Optional[List[pygame.Rect]] = None
         self.current_board_state = 'New'  # Default state
+        # Position of the left click made this frame, if any, set from MOUSEBUTTONDOWN events in handle_event
+        self._clicked_position: Optional[Tuple[int, int]] = None
 
         self.fonts = {
             "main_font": "MainFiles/assets/fonts/junegull/junegull rg.otf",
@@ -30,49 +110,52 @@ class MinesweeperUI:
         self._text_colour_1: Tuple[int, int, int] = (255, 255, 255)
         self._button_colour: Tuple[int, int, int] = (230, 135, 60)  # orange
 
+        # Rendered text surfaces keyed by (font_name, font_size, text, colour), least recently used evicted first
+        self._text_cache: OrderedDict = OrderedDict()
+        self._text_cache_size: int = 512
+
+        # The title and option descriptions of the options menu never change, so they are composited onto
+        # this surface the first time the menu is shown and blitted as one image on every frame after that
+        self._menu_static_surface: Optional[pygame.Surface] = None
+        self._menu_table_start_y: int = 0
+        # The input boxes of the options menu table, in row order, once the menu widgets have been laid out
+        self._menu_input_boxes: Tuple[UserInputHandler, ...] = ()
+
+        # The last table built by update_table and the arguments it was built from, so an unchanged
+        # stats panel is redrawn from the existing surfaces rather than rebuilt every frame
+        self._last_table_snapshot: Optional[tuple] = None
+        self._last_table: Optional[List[dict]] = None
+        # The raw stats the stats panel rows were last formatted from, and the formatted rows
+        self._last_stats_snapshot: Optional[tuple] = None
+        self._last_stats_rows: List[Tuple[str, str]] = []
+
         # Button dimensions
         button_width = 350
         button_height = 50
         vertical_spacing = 10
 
+        screen_width: int = self.game.get_screen_width()
+
         # Calculate x position to center buttons and align input boxes
-        center_x = (self.game.get_screen_width() // 2) - (button_width // 2)
+        center_x = (screen_width // 2) - (button_width // 2)
 
         # Add the game control buttons (Restart, AI Move, Options)
-        top_right_x: int = self.game.get_screen_width() - 430
+        top_right_x: int = screen_width - 430
         top_right_y: int = 20
 
-        self.reset_button = self.create_button(
-            'Reset',
-            top_right_x,
-            top_right_y,
-            'ui_font',
-            28,
-            self._text_colour_1,
-            150
-        )
-
-        self.start_button = self.create_button(
-            'Start',
-            top_right_x + 160,
-            top_right_y,
-            'ui_font',
-            28,
-            self._text_colour_1,
-            150
-        )
-
-        self.options_button = self.create_button(
-            'Options',
-            top_right_x - 160,
-            top_right_y,
-            'ui_font',
-            28,
-            self._text_colour_1,
-            150
-        )
+        # Game control buttons as (attribute name, label, x position), all 150 wide along the top right
+        control_button_specs: List[Tuple[str, str, int]] = [
+            ('reset_button', 'Reset', top_right_x),
+            ('start_button', 'Start', top_right_x + 160),
+            ('options_button', 'Options', top_right_x - 160),
+        ]
+        for attribute_name, label, x_position in control_button_specs:
+            setattr(self, attribute_name, self.create_button(
+                label, x_position, top_right_y, 'ui_font', 28, self._text_colour_1, 150
+            ))
 
-        # Input boxes
+        # Input boxes, keyed by label so rebuilding an input box reuses its handler and keeps its text
+        self._input_handlers: Dict[str, UserInputHandler] = {}
         input_box_width = 250
         input_box_height = button_height
 
@@ -103,101 +186,60 @@ class MinesweeperUI:
             font_colour=self._text_colour_1
         )
 
-        # Game speed button
-        self.speed_button = self.create_button(
-            'Fastest',
-            center_x,
-            input_box_start_y + 2 * (input_box_height + vertical_spacing),
-            'ui_font',
-            28,
-            self._text_colour_1
-        )
         self.speed_options: List[str] = ['Click per turn', 'Normal', 'Fastest']
         self.current_speed_index: int = 2  # Default to max speed
-
-        # Search algorithm button
-        self.search_algorithm_button = self.create_button(
-            'Brute Force',
-            center_x,
-            input_box_start_y + 3 * (input_box_height + vertical_spacing),
-            'ui_font',
-            28,
-            self._text_colour_1
-        )
-        self.safe_cell_strategy_button = self.create_button(
-            'First In, First Out',  # Default strategy
-            center_x,
-            input_box_start_y + 4 * (input_box_height + vertical_spacing),
-            'ui_font',
-            28,
-            self._text_colour_1
-        )
-
+        self.current_speed_name: str = self.speed_options[self.current_speed_index]
         self.safe_cell_strategies: List[str] = ['First In, First Out', 'Last In, First Out', 'Sorted by position', 'Random']
         self.current_safe_cell_strategy_index: int = 0  # Default to FIFO
+        self.current_safe_cell_strategy_name: str = self.safe_cell_strategies[self.current_safe_cell_strategy_index]
         self.start_position_options = ['Random cell', 'First cell', 'Centre cell', 'Last cell']
         self.current_start_position_index: int = 0  # Default to Random
-
-        # Create the Start Position button
-        self.start_position_button = self.create_button(
-            self.start_position_options[self.current_start_position_index],
-            center_x,
-            input_box_start_y + 8 * (input_box_height + vertical_spacing),  # Position below other options
-            'ui_font',
-            28,
-            self._text_colour_1
-        )
-        # Performance stats button
-        self.performance_stats_button = self.create_button(
-            'On',
-            center_x,
-            input_box_start_y + 4 * (input_box_height + vertical_spacing),
-            'ui_font',
-            28,
-            self._text_colour_1
-        )
-
-        # Inference logic button
-        self.inference_logic_button = self.create_button(
-            'Off',
-            center_x,
-            input_box_start_y + 5 * (input_box_height + vertical_spacing),
-            'ui_font',
-            28,
-            self._text_colour_1
-        )
-
-        self.game_stats_button = self.create_button(
-            'On',  # Default state is "On"
-            center_x,
-            input_box_start_y + 4 * (input_box_height + vertical_spacing),  # Position appropriately
-            'ui_font',
-            28,
-            self._text_colour_1
+        self.current_start_position_name: str = self.start_position_options[self.current_start_position_index]
+
+        # Options buttons as (attribute name, initial label, row), where each row is one input box height
+        # plus spacing below the first input box
+        option_button_specs: List[Tuple[str, str, int]] = [
+            ('speed_button', self.current_speed_name, 2),
+            ('search_algorithm_button', 'Brute Force', 3),
+            ('safe_cell_strategy_button', self.current_safe_cell_strategy_name, 4),
+            ('start_position_button', self.current_start_position_name, 8),
+            ('performance_stats_button', 'On', 4),
+            ('inference_logic_button', 'Off', 5),
+            ('game_stats_button', 'On', 4),
+            ('board_state_button', 'New', 6),  # Board state toggle button (New/Existing)
+            ('play_button', 'Play Game', 7),
+        ]
+        for attribute_name, label, row in option_button_specs:
+            setattr(self, attribute_name, self.create_button(
+                label, center_x, input_box_start_y + row * (input_box_height + vertical_spacing),
+                'ui_font', 28, self._text_colour_1
+            ))
+
+        # The options menu buttons redrawn by force_redraw_buttons, built once rather than on every frame
+        self._all_toggle_buttons: Tuple[Button, ...] = (
+            self.speed_button,
+            self.search_algorithm_button,
+            self.safe_cell_strategy_button,
+            self.performance_stats_button,
+            self.start_position_button,
+            self.inference_logic_button,
+            self.board_state_button,
+            self.play_button
         )
 
-        # Board state toggle button (New/Existing)
-        self.board_state_button = self.create_button(
-            'New',
-            center_x,
-            input_box_start_y + 6 * (input_box_height + vertical_spacing),
-            'ui_font',
-            28,
-            self._text_colour_1
-        )
-
-        # Play game button
-        self.play_button = self.create_button(
-            'Play Game',
-            center_x,
-            input_box_start_y + 7 * (input_box_height + vertical_spacing),
-            'ui_font',
-            28,
-            self._text_colour_1,
+        # The click handler of each options menu setting button, dispatched by handle_options_menu_clicks
+        self._options_menu_click_handlers: Tuple[Tuple[Button, Callable[[], None]], ...] = (
+            (self.speed_button, self.handle_speed_button_click),
+            (self.search_algorithm_button, self.handle_search_algorithm_button_click),
+            (self.safe_cell_strategy_button, self.handle_safe_cell_strategy_button_click),
+            (self.start_position_button, self.handle_start_position_button_click),
+            (self.performance_stats_button, self.handle_performance_stats_button_click),
+            (self.inference_logic_button, self.handle_inference_logic_button_click),
+            (self.board_state_button, self.handle_board_state_button_click)
         )
 
         # Adjust the error message label position to be below the Play Game button and centered
-        play_button_rect = self.play_button['rect']
+        play_button_rect = self.play_button.rect
         error_label_y_position = play_button_rect.bottom + 20
 
         self.error_message_label = self.create_label(
@@ -208,7 +250,7 @@ class MinesweeperUI:
             self._text_colour_1
         )
 
-        self.error_message_label[1].centerx = self.game.get_screen_width() // 2
+        self.error_message_label[1].centerx = screen_width // 2
 
         # Default settings for stats and logic options
         self.display_game_stats = True
@@ -246,24 +288,58 @@ class MinesweeperUI:
             'Random cell': 'random'
         }
 
-    def force_redraw_buttons(self) -> None:
+        # The labels of every option the cycling buttons can show, rendered once so a click is just a lookup
+        self._search_algorithm_label_surfaces: Dict[str, pygame.Surface] = self._render_button_labels(
+            {name: self.search_algorithm_display_names[name] for name in self.search_algorithms}
+        )
+        self._safe_cell_strategy_label_surfaces: Dict[str, pygame.Surface] = self._render_button_labels(
+            {strategy: strategy for strategy in self.safe_cell_strategies}
+        )
+        self._start_position_label_surfaces: Dict[str, pygame.Surface] = self._render_button_labels(
+            {position: position for position in self.start_position_options}
+        )
+        self._speed_label_surfaces: Dict[str, pygame.Surface] = self._render_button_labels(
+            {speed: speed for speed in self.speed_options}
+        )
+        self._board_state_label_surfaces: Dict[str, pygame.Surface] = self._render_button_labels(
+            {'New': 'New', 'Existing': 'Existing'}
+        )
+
+    def _render_button_labels(self, labels: Dict[str, str]) -> Dict[str, pygame.Surface]:
+        """
+        Renders the button label for each option of a cycling button.
+
+        :param labels: A dictionary mapping each option to the text shown on the button for it.
+        :return: A dictionary mapping each option to its rendered label surface.
+        """
+        return {option: self._render_text('ui_font', 28, label, self._text_colour_1) for option, label in labels.items()}
+
+    def _set_button_text(self, button: Button, text_surface: pygame.Surface) -> None:
+        """
+        Shows a new label on a button, centred on the button.
+
+        :param button: The button.
+        :param text_surface: The rendered label to show.
+        """
+        button.text = text_surface
+        # Each button owns its text_rect, so it is resized and recentred in place rather than replaced
+        text_rect = button.text_rect
+        text_rect.size = text_surface.get_size()
+        text_rect.center = button.rect.center
+
+    def force_redraw_buttons(self) -> List[pygame.Rect]:
         """
         Forces redraw of the text on buttons.
-        Fixes a bug where the button text is misaligned on startup
+        The labels are centred when the buttons are laid out and whenever they change,
+        which fixes a bug where the button text is misaligned on startup
+
+        :return: The areas of the screen drawn on.
         """
-        buttons = [
-            self.speed_button,
-            self.search_algorithm_button,
-            self.safe_cell_strategy_button,
-            self.performance_stats_button,
-            self.start_position_button,
-            self.inference_logic_button,
-            self.board_state_button,
-            self.play_button
-        ]
-        for button in buttons:
-            button['text_rect'] = button['text'].get_rect(center=button['rect'].center)
-            self.draw_button(button)
+        button_blits = []
+        for button in self._all_toggle_buttons:
+            button_blits.append((button.background, button.rect.topleft))
+            button_blits.append((button.text, button.text_rect))
+        return self.game.get_screen().blits(button_blits)
 
     def load_font(self, font_name: str, font_size: int) -> pygame.font.Font:
         """
@@ -273,11 +349,33 @@ class MinesweeperUI:
         :return: A pygame Font object.
         """
         font_path = self.fonts.get(font_name, self.fonts['main_font'])
-        return pygame.font.Font(font_path, font_size)
+        # Fonts are requested on every button update and menu frame, so each path and size is only parsed once
+        return _load_font_cached(font_path, font_size)
+
+    def _render_text(self, font_name: str, font_size: int, text: str,
+                     font_colour: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Renders text with the specified font, reusing the surface if the same text has been rendered before.
+        :param font_name: The key to identify the font path.
+        :param font_size: The size of the font.
+        :param text: The text to render.
+        :param font_colour: The colour of the text.
+        :return: The rendered text surface.
+        """
+        key = (font_name, font_size, text, tuple(font_colour))
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = _convert_for_display(self.load_font(font_name, font_size).render(text, True, font_colour))
+            self._text_cache[key] = text_surface
+            if len(self._text_cache) > self._text_cache_size:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return text_surface
 
     def create_button(self, text: str, x_position: int, y_position: int, font_name: str, font_size: int,
                       font_colour: Tuple[int, int, int], width: int = 250, height: int = 50,
-                      button_colour: Tuple[int, int, int] = (55, 55, 55)) -> dict:
+                      button_colour: Tuple[int, int, int] = (55, 55, 55)) -> Button:
         """
         Creates a button with the specified parameters.
         :param text: The text displayed on the button.
@@ -289,22 +387,18 @@ class MinesweeperUI:
         :param width: The width of the button.
         :param height: The height of the button.
         :param button_colour: The background color of the button.
-        :return: A dictionary representing the button's properties.
+        :return: The new Button.
         """
         button_rect = pygame.Rect(x_position, y_position, width, height)
-        button_text = self.load_font(font_name, font_size).render(text, True, font_colour)
+        button_text = self._render_text(font_name, font_size, text, font_colour)
 
         # Calculate text_rect to ensure it is centered within the button_rect
         button_text_rect = button_text.get_rect(center=button_rect.center)
 
-        return {
-            "rect": button_rect,
-            "text": button_text,
-            "text_rect": button_text_rect,
-            "button_colour": button_colour,
-            "state": text,  # Store the initial state (text) of the button here
-            "action": None  # Placeholder for future button action if needed
-        }
+        # The background never changes size or colour, so it is built once rather than on every draw
+        button_background = _build_rounded_rect_surface(width, height, tuple(self._button_colour), 0.3)
+
+        return Button(button_rect, button_text, button_text_rect, button_background, button_colour, text)
 
     def create_label(self, text: str, y_position: int, font_name: str, font_size: int,
                      font_colour: Tuple[int, int, int], input_box_height: int = None) -> Tuple[
@@ -319,8 +413,7 @@ class MinesweeperUI:
         :param input_box_height: The height of the input box to align the label with (optional).
         :return: A tuple containing the label surface and its rect.
         """
-        font = self.load_font(font_name, font_size)
-        label = font.render(text, True, font_colour)
+        label = self._render_text(font_name, font_size, text, font_colour)
         label_rect = label.get_rect()
 
         if input_box_height is not None:
@@ -358,7 +451,10 @@ class MinesweeperUI:
 
         # Positioning the input box right next to the label
         input_x_position: int = label_rect.right + 10  # Adjust as necessary to position it next to the label
-        input_box = UserInputHandler(input_x_position, y_position, width, height, text)
+        input_box = self._input_handlers.get(label_text)
+        if input_box is None:
+            input_box = UserInputHandler(input_x_position, y_position, width, height, text)
+            self._input_handlers[label_text] = input_box
 
         return {
             "label": label,
@@ -366,14 +462,15 @@ class MinesweeperUI:
             "box": input_box
         }
 
-    def draw_button(self, button: dict) -> None:
+    def draw_button(self, button: Button) -> None:
         """
         Draws a button on the screen.
 
-        :param button: The dictionary representing the button's properties.
+        :param button: The button.
         """
-        self.draw_rounded_rect(self.game.get_screen(), self._button_colour, button['rect'], radius=0.3)
-        self.game.get_screen().blit(button['text'], button['text_rect'])
+        screen = self.game.get_screen()
+        screen.blit(button.background, button.rect.topleft)
+        screen.blit(button.text, button.text_rect)
 
     def draw_rounded_rect(self, surface, color, rect, radius=0.4):
         """
@@ -385,11 +482,9 @@ class MinesweeperUI:
         :return: The rounded rectangle surface.
         """
         rect = pygame.Rect(rect)
-        corner_radius = min(rect.width, rect.height) * radius  # Adjust the corner radius
 
-        # Create the rectangle with rounded corners
-        rounded_rect_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(rounded_rect_surface, color, rounded_rect_surface.get_rect(), border_radius=int(corner_radius))
+        # Reuse the rectangle with rounded corners built for any earlier call of the same size, colour and radius
+        rounded_rect_surface = _build_rounded_rect_surface(rect.width, rect.height, tuple(color), radius)
 
         # Blit the rounded rectangle onto the target surface
         surface.blit(rounded_rect_surface, rect.topleft)
@@ -400,11 +495,13 @@ class MinesweeperUI:
 
         :return: A tuple of pygame.Rect objects for each button's rect.
         """
-        self.draw_button(self.reset_button)
-        self.draw_button(self.start_button)
-        self.draw_button(self.options_button)
+        control_blits = []
+        for button in (self.reset_button, self.start_button, self.options_button):
+            control_blits.append((button.background, button.rect.topleft))
+            control_blits.append((button.text, button.text_rect))
+        self.game.get_screen().blits(control_blits, doreturn=False)
 
-        return self.reset_button['rect'], self.start_button['rect'], self.options_button['rect']
+        return self.reset_button.rect, self.start_button.rect, self.options_button.rect
 
     def draw_label(self, label: pygame.Surface, label_rect: pygame.Rect) -> None:
         """
@@ -424,43 +521,72 @@ class MinesweeperUI:
         self.draw_label(input_box['label'], input_box['label_rect'])
         input_box['box'].draw_input_box(self.game.get_screen())  # Updated method name
 
-    def handle_button_click(self, button: dict) -> bool:
+    def clear_click(self) -> None:
+        """
+        Forgets the click recorded for the previous frame. Called before the frame's events are handled.
+        """
+        self._clicked_position = None
+
+    def handle_events(self, events: List[pygame.event.Event]) -> None:
+        """
+        Records the position of a left click so the buttons can be checked against it this frame.
+
+        :param events: The events taken from the queue this frame.
+        """
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._clicked_position = event.pos
+
+    def get_click_position(self) -> Optional[Tuple[int, int]]:
+        """
+        Returns the position of the left click made this frame.
+
+        :return: The click position, or None if there was no left click this frame.
+        """
+        return self._clicked_position
+
+    def handle_button_click(self, button: Button) -> bool:
         """
         Handles the button click event.
+        A click is taken from the MOUSEBUTTONDOWN event, so each press is only seen once
+        rather than on every frame the mouse button is held down.
 
-        :param button: The dictionary representing the button's properties.
+        :param button: The button.
         :return: True if the button is clicked, False otherwise.
         """
-        click, _, _ = pygame.mouse.get_pressed()
-        if click == 1:
-            mouse_position = pygame.mouse.get_pos()
-            if button['rect'].collidepoint(mouse_position):
-                return True
+        if self._clicked_position is not None and button.rect.collidepoint(self._clicked_position):
+            return True
         return False
 
+    def handle_options_menu_clicks(self) -> None:
+        """
+        Handles a click on any of the options menu setting buttons.
+        Most frames have no click, and a click can only be on one button, so at most one handler is run.
+        The click is tested against each button here only, so the handlers run without testing it again.
+        """
+        if self._clicked_position is None:
+            return
+        for button, click_handler in self._options_menu_click_handlers:
+            if button.rect.collidepoint(self._clicked_position):
+                click_handler()
+                return
+
     def handle_search_algorithm_button_click(self) -> None:
         """
                 Handles the click event for the 'Search Algorithm' button.
 
                 Cycles through the available search algorithm options.
                 """
-        if self.handle_button_click(self.search_algorithm_button):
-            # Update the current algorithm index and name
-            self.current_algorithm_index = (self.current_algorithm_index + 1) % len(self.search_algorithms)
-            self.current_search_algorithm_name = self.search_algorithms[self.current_algorithm_index]
-
-            # Debugging print statement
-            print(f"Algorithm changed to: {self.current_search_algorithm_name} (Index: {self.current_algorithm_index})")
-
-            # Update the button text to display the new algorithm name
-            self.search_algorithm_button['text'] = self.load_font('ui_font', 28).render(
-                self.search_algorithm_display_names[self.search_algorithms[self.current_algorithm_index]], True,
-                self._text_colour_1
-            )
-            self.search_algorithm_button['text_rect'] = self.search_algorithm_button['text'].get_rect(
-                center=self.search_algorithm_button['rect'].center
-            )
-            pygame.time.wait(200)  # Add a delay to avoid rapid cycling
+        # Update the current algorithm index and name
+        self.current_algorithm_index = (self.current_algorithm_index + 1) % len(self.search_algorithms)
+        self.current_search_algorithm_name = self.search_algorithms[self.current_algorithm_index]
+
+        # Debugging print statement
+        print(f"Algorithm changed to: {self.current_search_algorithm_name} (Index: {self.current_algorithm_index})")
+
+        # Update the button text to display the new algorithm name
+        self._set_button_text(self.search_algorithm_button,
+                              self._search_algorithm_label_surfaces[self.current_search_algorithm_name])
 
     def handle_start_position_button_click(self) -> None:
         """
@@ -468,25 +594,22 @@ class MinesweeperUI:
 
         Cycles through the available start position options.
         """
-        if self.handle_button_click(self.start_position_button):
-            # Cycle through the start position options
-            self.current_start_position_index = (self.current_start_position_index + 1) % len(
-                self.start_position_options)
-            current_position_name = self.start_position_options[self.current_start_position_index]
-
-            # Update the button text to display the new start position name
-            self.start_position_button['text'] = self.load_font('ui_font', 28).render(
-                current_position_name, True, self._text_colour_1
-            )
-            self.start_position_button['text_rect'] = self.start_position_button['text'].get_rect(
-                center=self.start_position_button['rect'].center
-            )
-            pygame.time.wait(200)  # Add a delay to avoid rapid cycling
-
-    def build_2_col_table(self, start_x: int, start_y: int, rows: List[Tuple[str, any]],
-                          col_widths: Tuple[int, int], row_height: int = 30, font_size: int = 20) -> List[dict]:
+        # Cycle through the start position options
+        self.current_start_position_index = (self.current_start_position_index + 1) % len(
+            self.start_position_options)
+        self.current_start_position_name = self.start_position_options[self.current_start_position_index]
+
+        # Update the button text to display the new start position name
+        self._set_button_text(self.start_position_button,
+                              self._start_position_label_surfaces[self.current_start_position_name])
+
+    def build_2_col_mixed_table(self, start_x: int, start_y: int, rows: List[Tuple[str, any]],
+                                col_widths: Tuple[int, int], row_height: int = 30,
+                                font_size: int = 20) -> List[dict]:
         """
         Builds a 2-column table at the specified location with the given rows and column widths.
+        Values may be pre-rendered surfaces as well as strings; tables of strings only are built by
+        build_2_col_string_table, which skips the per-row type check.
 
         :param start_x: The starting X coordinate for the table.
         :param start_y: The starting Y coordinate for the table.
@@ -497,23 +620,28 @@ class MinesweeperUI:
         :return: A list of dictionaries where each dictionary contains the surfaces and rects for a table row.
         """
         table_rows = []
-        font = self.load_font('ui_font', font_size)
+        # Bound once outside the loop rather than looked up on every row
+        render_text = self._render_text
+        text_colour = self._text_colour_1
 
-        for index, (description, value) in enumerate(rows):
-            y_position = start_y + index * row_height
+        # Column positions are the same for every row, and each row's rects are already row_height tall,
+        # so they sit centred on the row without being re-centred
+        description_x = start_x + 10
+        value_x = start_x + col_widths[0]
+        half_row_height = row_height // 2
 
-            description_surf = font.render(description, True, self._text_colour_1)
-            description_rect = pygame.Rect(start_x + 10, y_position, col_widths[0], row_height)
-            description_rect.centery = y_position + (row_height // 2)
+        for y_position, (description, value) in zip(range(start_y, start_y + len(rows) * row_height, row_height),
+                                                    rows):
+            description_surf = render_text('ui_font', font_size, description, text_colour)
+            description_rect = pygame.Rect(description_x, y_position, col_widths[0], row_height)
 
             # Handle different types of values
             if isinstance(value, pygame.Surface):
                 value_surf = value
-                value_rect = value.get_rect(midleft=(start_x + col_widths[0] + 10, y_position + (row_height // 2)))
+                value_rect = value.get_rect(midleft=(value_x + 10, y_position + half_row_height))
             else:
-                value_surf = font.render(str(value), True, self._text_colour_1)
-                value_rect = pygame.Rect(start_x + col_widths[0], y_position, col_widths[1], row_height)
-                value_rect.centery = y_position + (row_height // 2)
+                value_surf = render_text('ui_font', font_size, str(value), text_colour)
+                value_rect = pygame.Rect(value_x, y_position, col_widths[1], row_height)
 
             table_rows.append({
                 "description_surf": description_surf,
@@ -524,6 +652,41 @@ class MinesweeperUI:
 
         return table_rows
 
+    def build_2_col_string_table(self, start_x: int, start_y: int, rows: List[Tuple[str, str]],
+                                 col_widths: Tuple[int, int], row_height: int = 30,
+                                 font_size: int = 20) -> List[dict]:
+        """
+        Builds a 2-column table whose values are all strings, without checking each value's type.
+
+        :param start_x: The starting X coordinate for the table.
+        :param start_y: The starting Y coordinate for the table.
+        :param rows: A list of tuples where each tuple contains (description, value) string pairs.
+        :param col_widths: A tuple specifying the width of the first column (description) and the second column (value).
+        :param row_height: The height of each row in the table.
+        :param font_size: The font size to be used in the table.
+        :return: A list of dictionaries where each dictionary contains the surfaces and rects for a table row.
+        """
+        table_rows = []
+        # Bound once outside the loop rather than looked up on every row
+        render_text = self._render_text
+        text_colour = self._text_colour_1
+
+        # Column positions are the same for every row, and each row's rects are already row_height tall,
+        # so they sit centred on the row without being re-centred
+        description_x = start_x + 10
+        value_x = start_x + col_widths[0]
+
+        for y_position, (description, value) in zip(range(start_y, start_y + len(rows) * row_height, row_height),
+                                                    rows):
+            table_rows.append({
+                "description_surf": render_text('ui_font', font_size, description, text_colour),
+                "description_rect": pygame.Rect(description_x, y_position, col_widths[0], row_height),
+                "value_surf": render_text('ui_font', font_size, value, text_colour),
+                "value_rect": pygame.Rect(value_x, y_position, col_widths[1], row_height)
+            })
+
+        return table_rows
+
     def build_3_col_table(self, start_x: int, start_y: int, rows: List[Tuple[str, str, str]],
                           col_widths: Tuple[int, int, int], row_height: int = 30, font_size: int = 20) -> List[dict]:
         """
@@ -539,26 +702,29 @@ class MinesweeperUI:
         :return: A list of dictionaries where each dictionary contains the surfaces and rects for a table row.
         """
         table_rows = []
-        font = self.load_font('ui_font', font_size)
-
-        for index, (description, value, third_value) in enumerate(rows):
-            y_position = start_y + index * row_height
-
+        # Bound once outside the loop rather than looked up on every row
+        render_text = self._render_text
+        text_colour = self._text_colour_1
+
+        # Column positions are the same for every row, and each row's rects are already row_height tall,
+        # so they sit centred on the row without being re-centred
+        description_x = start_x + 10
+        value_x = start_x + col_widths[0]
+        third_value_x = value_x + col_widths[1]
+
+        for y_position, (description, value, third_value) in zip(
+                range(start_y, start_y + len(rows) * row_height, row_height), rows):
             # First column
-            description_surf = font.render(description, True, self._text_colour_1)
-            description_rect = pygame.Rect(start_x + 10, y_position, col_widths[0], row_height)
-            description_rect.centery = y_position + (row_height // 2)
+            description_surf = render_text('ui_font', font_size, description, text_colour)
+            description_rect = pygame.Rect(description_x, y_position, col_widths[0], row_height)
 
             # Second column
-            value_surf = font.render(value, True, self._text_colour_1)
-            value_rect = pygame.Rect(start_x + col_widths[0], y_position, col_widths[1], row_height)
-            value_rect.centery = y_position + (row_height // 2)
+            value_surf = render_text('ui_font', font_size, value, text_colour)
+            value_rect = pygame.Rect(value_x, y_position, col_widths[1], row_height)
 
             # Third column
-            third_value_surf = font.render(third_value, True, self._text_colour_1)
-            third_value_rect = pygame.Rect(start_x + col_widths[0] + col_widths[1], y_position, col_widths[2],
-                                           row_height)
-            third_value_rect.centery = y_position + (row_height // 2)
+            third_value_surf = render_text('ui_font', font_size, third_value, text_colour)
+            third_value_rect = pygame.Rect(third_value_x, y_position, col_widths[2], row_height)
 
             table_rows.append({
                 "description_surf": description_surf,
@@ -571,35 +737,51 @@ class MinesweeperUI:
 
         return table_rows
 
-    def draw_table(self, table_rows: List[dict]) -> None:
+    def draw_table(self, table_rows: List[dict]) -> List[pygame.Rect]:
         """
         Draws a previously built table on the screen.
 
         :param table_rows: A list of dictionaries where each dictionary contains the surfaces and rects for a table row.
+        :return: The areas of the screen covered by the table's text.
         """
+        # Collect every cell of the table and hand them to pygame in a single blits call
+        table_blits = []
         for row in table_rows:
-            self.game.get_screen().blit(row["description_surf"], row["description_rect"])
-            self.game.get_screen().blit(row["value_surf"], row["value_rect"])
+            table_blits.append((row["description_surf"], row["description_rect"]))
+            table_blits.append((row["value_surf"], row["value_rect"]))
+            if "third_value_surf" in row:
+                table_blits.append((row["third_value_surf"], row["third_value_rect"]))
+        return self.game.get_screen().blits(table_blits)
 
-    def draw_performance_stats_panel(self, performance_stats: dict, game_stats: dict) -> None:
+    def draw_performance_stats_panel(self, performance_stats: dict, game_stats: dict) -> Optional[pygame.Rect]:
         """
+        Draws the panel of performance and game statistics beneath the game control buttons, if it is shown.
 
-        :param performance_stats:
-        :param game_stats:
-        :return:
+        :param performance_stats: The summary of performance statistics from the StatGenerator.
+        :param game_stats: The game statistics from the runner.
+        :return: The area of the screen the panel was drawn in, or None if the panel is hidden.
         """
-        if self.display_performance_stats:
-            start_x = self.options_button['rect'].left
-            start_y = self.options_button['rect'].bottom + 50
-
-            rows = [
+        if not self.display_performance_stats:
+            return None
+
+        start_x = self.options_button.rect.left
+        start_y = self.options_button.rect.bottom + 50
+
+        # The rows are only formatted again when one of the values they show has changed
+        stats_snapshot = (
+            tuple(performance_stats.values()),
+            tuple(game_stats.values()),
+            self.current_search_algorithm_name,
+            self.current_safe_cell_strategy_name
+        )
+        if stats_snapshot != self._last_stats_snapshot:
+            self._last_stats_rows = [
                 ("Board size:", game_stats["Board size"]),
                 ("Hidden mines remaining:", str(game_stats["Mines remaining"])),
                 ("Number of known mine positions:", str(game_stats["Known mines"])),
                 ("Known safe moves remaining: ", str(game_stats["Safe moves"])),
                 ("Search Algorithm:", self.search_algorithm_display_names[self.current_search_algorithm_name]),
-                ("Safe Cell Strategy:", self.safe_cell_strategy_display_names[
-                    self.safe_cell_strategies[self.current_safe_cell_strategy_index]]),
+                ("Safe Cell Strategy:", self.safe_cell_strategy_display_names[self.current_safe_cell_strategy_name]),
                 ("Knowledge Base (Average Size):", f"{performance_stats['knowledge_base_avg_size']:.2f}"),
                 ("Knowledge Base (Maximum Size):", str(performance_stats["knowledge_base_max_size"])),
                 ("Total Inferences Made:", str(performance_stats["inferences_total"])),
@@ -612,12 +794,14 @@ class MinesweeperUI:
                 ("Total AI Decision Loops:", str(performance_stats["iterations_total"])),
                 ("Duplicate Non-Empty Inferences (Total):", str(performance_stats["duplicate_inferences_total"]))
             ]
+            self._last_stats_snapshot = stats_snapshot
 
-            col_widths = (330, 120)
-            self.update_table(start_x=start_x, start_y=start_y, rows=rows, col_widths=col_widths, font_size=22)
+        col_widths = (330, 120)
+        return self.update_table(start_x=start_x, start_y=start_y, rows=self._last_stats_rows,
+                                 col_widths=col_widths, font_size=22)
 
     def update_table(self, start_x: int, start_y: int, rows: List[Tuple[str, str]],
-                     col_widths: Tuple[int, int], row_height: int = 30, font_size: int = 20) -> None:
+                     col_widths: Tuple[int, int], row_height: int = 30, font_size: int = 20) -> pygame.Rect:
         """
         Updates and redraws a table at the specified location with the given rows and column widths.
 
@@ -627,31 +811,32 @@ class MinesweeperUI:
         :param col_widths: A tuple specifying the width of the first column (description) and the second column (value).
         :param row_height: The height of each row in the table.
         :param font_size: The font size to be used in the table.
+        :return: The area of the screen the table was drawn in, including any text running past its columns.
         """
         # Clear the area where the table will be drawn
         table_height = len(rows) * row_height
         table_width = sum(col_widths)
 
-        pygame.draw.rect(
+        table_rect = pygame.draw.rect(
             self.game.get_screen(),
             self._background_colour,
             (start_x, start_y, table_width, table_height)
         )
-        # Build and draw the table with the latest stats
-        table = self.build_2_col_table(start_x, start_y, rows, col_widths, row_height, font_size)
-        self.draw_table(table)
+        # Build and draw the table with the latest stats, only rebuilding it if any of the stats have changed
+        table_snapshot = (start_x, start_y, tuple(rows), col_widths, row_height, font_size)
+        if table_snapshot != self._last_table_snapshot:
+            self._last_table = self.build_2_col_string_table(start_x, start_y, rows, col_widths, row_height,
+                                                             font_size)
+            self._last_table_snapshot = table_snapshot
+        return table_rect.unionall(self.draw_table(self._last_table))
 
     def handle_speed_button_click(self) -> None:
         """
         Handles the click event for the speed button, cycling through the speed options.
         """
-        if self.handle_button_click(self.speed_button):
-            self.current_speed_index = (self.current_speed_index + 1) % len(self.speed_options)
-            self.speed_button['text'] = self.load_font('ui_font', 28).render(
-                self.speed_options[self.current_speed_index], True, self._text_colour_1
-            )
-            self.speed_button['text_rect'] = self.speed_button['text'].get_rect(center=self.speed_button['rect'].center)
-            pygame.time.wait(200)  # Add a delay to avoid rapid cycling
+        self.current_speed_index = (self.current_speed_index + 1) % len(self.speed_options)
+        self.current_speed_name = self.speed_options[self.current_speed_index]
+        self._set_button_text(self.speed_button, self._speed_label_surfaces[self.current_speed_name])
 
     def handle_board_state_button_click(self) -> None:
         """
@@ -659,30 +844,46 @@ class MinesweeperUI:
 
         Toggles the state between 'New' and 'Existing'.
         """
-        if self.handle_button_click(self.board_state_button):
-            # Toggle the state
-            self.current_board_state = 'Existing' if self.current_board_state == 'New' else 'New'
+        # Toggle the state
+        self.current_board_state = 'Existing' if self.current_board_state == 'New' else 'New'
 
-            # Update the button text
-            self.board_state_button['text'] = self.load_font('ui_font', 28).render(
-                self.current_board_state, True, self._text_colour_1
-            )
-            self.board_state_button['text_rect'] = self.board_state_button['text'].get_rect(
-                center=self.board_state_button['rect'].center
-            )
-            pygame.time.wait(200)  # Add a delay to avoid rapid toggling
+        # Update the button text
+        self._set_button_text(self.board_state_button, self._board_state_label_surfaces[self.current_board_state])
 
-    def display_options_menu(self) -> None:
+    def _options_menu_rows(self) -> List[Tuple[str, object]]:
         """
-        Displays the Options Menu on the screen using a table layout.
+        Returns the rows of the options menu table.
+
+        :return: A list of (description, widget) pairs, where each widget is an input box or a button.
         """
-        self.game.get_screen().fill(self._background_colour)
+        return [
+            ("Board Size", self.board_size_input['box']),
+            ("Percentage of Mines (%)", self.mines_input['box']),
+            ("Game Speed", self.speed_button),
+            ("Search Algorithm", self.search_algorithm_button),
+            ("Safe Cell Strategy", self.safe_cell_strategy_button),
+            ("Start Position", self.start_position_button),
+            ("Performance Stats", self.performance_stats_button),
+            ("Inference Logic", self.inference_logic_button),
+            ("Board State", self.board_state_button),
+        ]
+
+    def _render_options_menu_static_surface(self) -> pygame.Surface:
+        """
+        Renders the parts of the options menu that never change (background, title and option descriptions)
+        onto a surface the size of the screen.
+
+        :return: The surface holding the static parts of the options menu.
+        """
+        screen_width = self.game.get_screen_width()
+        menu_surface = pygame.Surface(self.game.get_screen().get_size())
+        menu_surface.fill(self._background_colour)
 
         # Draw the first line of the title ("Minesweeper") and center it
         minesweeper_label, minesweeper_rect = self.create_label("MinesweeperAI", 50, 'main_font', 100,
                                                                 self._text_colour_1)
-        minesweeper_rect.centerx = self.game.get_screen_width() // 2  # Center the label horizontally
-        self.draw_label(minesweeper_label, minesweeper_rect)
+        minesweeper_rect.centerx = screen_width // 2  # Center the label horizontally
+        menu_surface.blit(minesweeper_label, minesweeper_rect)
 
         # Draw the second line of the title ("Plug and play data structures and algorithms") and center it
         subtitle_label, subtitle_rect = self.create_label(
@@ -691,69 +892,112 @@ class MinesweeperUI:
             'ui_font', 60,  # Use the UI font and a smaller size
             self._text_colour_1
         )
-        subtitle_rect.centerx = self.game.get_screen_width() // 2  # Center the label horizontally
-        self.draw_label(subtitle_label, subtitle_rect)
+        subtitle_rect.centerx = screen_width // 2  # Center the label horizontally
+        menu_surface.blit(subtitle_label, subtitle_rect)
 
         # Define the starting coordinates for the table
-        start_x = (self.game.get_screen_width() // 2) - 300  # Adjust to center the table
-        start_y = subtitle_rect.bottom + 50
-        col_widths = (250, 200)
-
-        # Define the table rows
-        rows = [
-            ("Board Size", self.board_size_input['box']),
-            ("Percentage of Mines (%)", self.mines_input['box']),
-            ("Game Speed", self.speed_button),
-            ("Search Algorithm", self.search_algorithm_button),
-            ("Safe Cell Strategy", self.safe_cell_strategy_button),
-            ("Start Position", self.start_position_button),
-            ("Performance Stats", self.performance_stats_button),
-            ("Inference Logic", self.inference_logic_button),
-            ("Board State", self.board_state_button),
-        ]
+        start_x = (screen_width // 2) - 300  # Adjust to center the table
+        self._menu_table_start_y = subtitle_rect.bottom + 50
 
-        # Draw the table rows
-        for i, (description, widget) in enumerate(rows):
-            y_position = start_y + i * 70  # Adjust spacing as needed
+        # Draw the description labels of the table rows
+        for i, (description, _) in enumerate(self._options_menu_rows()):
+            y_position = self._menu_table_start_y + i * 70  # Adjust spacing as needed
             description_label, description_rect = self.create_label(description, y_position, 'ui_font', 28,
                                                                     self._text_colour_1)
             description_rect.x = start_x + 10
             description_rect.centery = y_position + 30
+            menu_surface.blit(description_label, description_rect)
 
-            # Draw the description label
-            self.draw_label(description_label, description_rect)
+        return menu_surface
+
+    def _lay_out_options_menu_widgets(self) -> None:
+        """
+        Positions the input boxes and buttons of the options menu table and the Play Game button.
+        The layout never changes, so this is done once, alongside rendering the static menu surface.
+        """
+        # Define the starting coordinates for the table
+        start_x = (self.game.get_screen_width() // 2) - 300  # Adjust to center the table
+        start_y = self._menu_table_start_y
+        col_widths = (250, 200)
+
+        # Define the table rows
+        rows = self._options_menu_rows()
+        input_boxes: List[UserInputHandler] = []
+
+        for i, (_, widget) in enumerate(rows):
+            y_position = start_y + i * 70  # Adjust spacing as needed
 
             if isinstance(widget, UserInputHandler):
                 # If the widget is an input box
                 widget.input_box_rect.x = start_x + col_widths[0] + 10
                 widget.input_box_rect.y = y_position
-                widget.draw_input_box(self.game.get_screen())
+                input_boxes.append(widget)
             else:
                 # If the widget is a button
-                widget_rect = widget['rect']
+                widget_rect = widget.rect
                 widget_rect.x = start_x + col_widths[0] + 10
                 widget_rect.centery = y_position + 30
-                self.draw_button(widget)
 
-        # Draw Play Game button across the bottom
-        self.play_button['rect'].y = start_y + len(rows) * 70 + 50  # Adjust Y position to be below the table
-        self.play_button['text_rect'] = self.play_button['text'].get_rect(center=self.play_button['rect'].center)
-        self.draw_button(self.play_button)
+        # Place Play Game button across the bottom
+        self.play_button.rect.y = start_y + len(rows) * 70 + 50  # Adjust Y position to be below the table
+
+        # Centre each button's current label on its laid out rect
+        for button in self._all_toggle_buttons:
+            self._set_button_text(button, button.text)
+
+        self._menu_input_boxes = tuple(input_boxes)
 
-        self.force_redraw_buttons()
+    def display_options_menu(self) -> None:
+        """
+        Displays the Options Menu on the screen using a table layout.
+        """
+        if self._menu_static_surface is None:
+            self._menu_static_surface = _convert_for_display(self._render_options_menu_static_surface())
+            self._lay_out_options_menu_widgets()
+        # The widget layout is fixed, so each frame is only the blits below, with the screen bound once
+        screen = self.game.get_screen()
+        screen.blit(self._menu_static_surface, (0, 0))
+
+        # Areas of the screen that can differ from the static menu surface on this frame
+        dirty_rects: List[pygame.Rect] = []
+
+        # Draw the table row widgets, the description labels are part of the static menu surface
+        for input_box in self._menu_input_boxes:
+            dirty_rects.append(input_box.draw_input_box(screen))
+        dirty_rects.extend(self.force_redraw_buttons())
 
         # Display error message if any
         if self.error_message:
-            error_label_y_position = self.play_button['rect'].bottom + 20
+            error_label_y_position = self.play_button.rect.bottom + 20
             error_label, error_rect = self.create_label(self.error_message,
                                                         error_label_y_position,
                                                         'main_font',
                                                         20,
                                                         self._text_colour_1)
-            error_rect.centerx = self.game.get_screen_width() // 2  # Center the label horizontally
-            self.draw_label(error_label, error_rect)
+            error_rect.centerx = screen.get_width() // 2  # Center the label horizontally
+            dirty_rects.append(screen.blit(error_label, error_rect))
 
-        pygame.display.flip()
+        if self._menu_dirty_rects is None:
+            pygame.display.flip()
+        else:
+            # Everything else is the unchanged static menu, so only the areas drawn on this frame or
+            # the last one are sent to the display, the latter so that anything no longer drawn is cleared
+            pygame.display.update(dirty_rects + self._menu_dirty_rects)
+        self._menu_dirty_rects = dirty_rects
+
+    def open_options_menu(self) -> None:
+        """
+        Opens the options menu, so that its next frame is drawn to the whole display.
+        """
+        self.options_menu_open = True
+        self._menu_dirty_rects = None
+
+    def redraw_whole_display(self) -> None:
+        """
+        Makes the next options menu frame update the whole display rather than only the areas that changed,
+        for when the window's contents have been lost, such as after it was covered or minimised.
+        """
+        self._menu_dirty_rects = None
 
     def handle_safe_cell_strategy_button_click(self) -> None:
         """
@@ -761,20 +1005,14 @@ class MinesweeperUI:
         Cycles through all available safe cell data structure options.
         Updates the button text to reflect the current state.
         """
-        if self.handle_button_click(self.safe_cell_strategy_button):
-            # Update the current safe cell strategy index and name
-            self.current_safe_cell_strategy_index = (self.current_safe_cell_strategy_index + 1) % len(
-                self.safe_cell_strategies)
-            current_strategy_name = self.safe_cell_strategies[self.current_safe_cell_strategy_index]
-
-            # Update the button text to display the new safe cell strategy name
-            self.safe_cell_strategy_button['text'] = self.load_font('ui_font', 28).render(
-                current_strategy_name, True, self._text_colour_1
-            )
-            self.safe_cell_strategy_button['text_rect'] = self.safe_cell_strategy_button['text'].get_rect(
-                center=self.safe_cell_strategy_button['rect'].center
-            )
-            pygame.time.wait(200)  # Add a delay to avoid rapid cycling
+        # Update the current safe cell strategy index and name
+        self.current_safe_cell_strategy_index = (self.current_safe_cell_strategy_index + 1) % len(
+            self.safe_cell_strategies)
+        self.current_safe_cell_strategy_name = self.safe_cell_strategies[self.current_safe_cell_strategy_index]
+
+        # Update the button text to display the new safe cell strategy name
+        self._set_button_text(self.safe_cell_strategy_button,
+                              self._safe_cell_strategy_label_surfaces[self.current_safe_cell_strategy_name])
 
     def handle_performance_stats_button_click(self) -> None:
         """
@@ -804,14 +1042,13 @@ class MinesweeperUI:
             'Inference Logic: Off'
         )
 
-    def toggle_button(self, button: dict, display_flag: bool, label_on: str, label_off: str) -> bool:
+    def toggle_button(self, button: Button, display_flag: bool, label_on: str, label_off: str) -> bool:
         """
           Toggles the state of a button and updates its text.
-          This method checks if the button was clicked, then toggles the display flag and updates
-          the button's text accordingly. A small delay is introduced after toggling to ensure smooth UI interaction.
+          This method is called once the button is known to have been clicked, and toggles the display flag
+          and updates the button's text accordingly.
 
-          :param button: A dictionary representing the button to toggle. It should contain keys such as
-                        'text' and 'rect' for updating the button's display properties.
+          :param button: The button to toggle.
           :param display_flag: A boolean indicating the current state of the display.
                                If True, the button is considered "on".
           :param label_on: The text to display on the button when the display flag is True.
@@ -819,25 +1056,25 @@ class MinesweeperUI:
 
           :return: A boolean representing the new state of the display flag after toggling.
           """
-        if self.handle_button_click(button):
-            display_flag = not display_flag
-            new_text = label_on if display_flag else label_off
-            button['text'] = self.load_font('ui_font', 28).render(new_text, True, self._text_colour_1)
-            button['text_rect'] = button['text'].get_rect(center=button['rect'].center)
-            pygame.time.wait(200)
+        display_flag = not display_flag
+        new_text = label_on if display_flag else label_off
+        self._set_button_text(button, self._render_text('ui_font', 28, new_text, self._text_colour_1))
         return display_flag
 
+    def set_board_state(self, board_state: str) -> None:
+        """
+        Sets the board state and shows its pre-rendered label on the board state button.
+
+        :param board_state: The new board state, either 'New' or 'Existing'.
+        """
+        self.current_board_state = board_state
+        self._set_button_text(self.board_state_button, self._board_state_label_surfaces[board_state])
+
     def update_board_state_to_new(self) -> None:
         """
         Updates the board state to 'New' and refreshes the button text.
         """
-        self.current_board_state = "New"
-        self.board_state_button['text'] = self.load_font('ui_font', 28).render(
-            "New", True, self._text_colour_1
-        )
-        self.board_state_button['text_rect'] = self.board_state_button['text'].get_rect(
-            center=self.board_state_button['rect'].center
-        )
+        self.set_board_state("New")
 
     def get_background_colour(self) -> Tuple[int, int, int]:
         """
@@ -1,4 +1,4 @@
-from typing import Tuple, Deque, Union
+from typing import Deque, Union
 import random
 
 class SafeCellDataStructures:
@@ -9,6 +9,8 @@ class SafeCellDataStructures:
     def __init__(self):
         """
         Initialise the strategy dictionary.
+        The strategies only use the cells they are given, so they are static methods
+        and the dictionary holds plain functions rather than methods bound to this instance.
         """
         self.strategies = {
             "First In, First Out": self.select_fifo,
@@ -30,51 +32,59 @@ class SafeCellDataStructures:
         print(f"ERROR: Strategy '{strategy_name}' not found, defaulting to FIFO")
         return self.select_fifo
 
-    def select_fifo(self, identified_safe_cells: Deque[Tuple[int, int]]) -> Union[Tuple[int, int], None]:
+    @staticmethod
+    def select_fifo(identified_safe_cells: Deque[int]) -> Union[int, None]:
         """
         Select a cell using the FIFO (First-In-First-Out) strategy.
 
-        :param identified_safe_cells: Deque of identified safe cells.
+        :param identified_safe_cells: Deque of identified safe cells, as packed cell indices.
         :return: The selected cell or None if no cells are available.
         """
         if identified_safe_cells:
             return identified_safe_cells.popleft()
         return None
 
-    def select_lifo(self, identified_safe_cells: Deque[Tuple[int, int]]) -> Union[Tuple[int, int], None]:
+    @staticmethod
+    def select_lifo(identified_safe_cells: Deque[int]) -> Union[int, None]:
         """
         Select a cell using the LIFO (Last-In-First-Out) strategy.
 
-        :param identified_safe_cells: Deque of identified safe cells.
+        :param identified_safe_cells: Deque of identified safe cells, as packed cell indices.
         :return: The selected cell or None if no cells are available.
         """
         if identified_safe_cells:
             return identified_safe_cells.pop()
         return None
 
-    def select_sorted(self, identified_safe_cells: Deque[Tuple[int, int]]) -> Union[Tuple[int, int], None]:
+    @staticmethod
+    def select_sorted(identified_safe_cells: Deque[int]) -> Union[int, None]:
         """
         Select a cell by sorting based on proximity to the top-left corner.
 
-        :param identified_safe_cells: Deque of identified safe cells.
+        :param identified_safe_cells: Deque of identified safe cells, as packed cell indices.
         :return: The selected cell or None if no cells are available.
         """
         if identified_safe_cells:
-            sorted_cells = sorted(identified_safe_cells, key=lambda x: (x[0], x[1]))
-            selected_cell = sorted_cells[0]
+            # Packed indices are row-major, so natural integer order is top-left first and only
+            # the smallest cell is needed, which min finds in a single pass without sorting the rest
+            selected_cell = min(identified_safe_cells)
             identified_safe_cells.remove(selected_cell)
             return selected_cell
         return None
 
-    def select_random(self, identified_safe_cells: Deque[Tuple[int, int]]) -> Union[Tuple[int, int], None]:
+    @staticmethod
+    def select_random(identified_safe_cells: Deque[int]) -> Union[int, None]:
         """
         Select a cell randomly from the identified safe cells.
 
-        :param identified_safe_cells: Deque of identified safe cells.
+        :param identified_safe_cells: Deque of identified safe cells, as packed cell indices.
         :return: The selected cell or None if no cells are available.
         """
         if identified_safe_cells:
-            selected_cell = random.choice(identified_safe_cells)
-            identified_safe_cells.remove(selected_cell)
-            return selected_cell
+            # The order of the remaining cells does not matter here, so the chosen cell is swapped to the end
+            # and popped rather than searched for and removed from the middle of the deque
+            selected_index = random.randrange(len(identified_safe_cells))
+            identified_safe_cells[selected_index], identified_safe_cells[-1] = \
+                identified_safe_cells[-1], identified_safe_cells[selected_index]
+            return identified_safe_cells.pop()
         return None
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class StatGenerator:
@@ -6,6 +6,24 @@ class StatGenerator:
     Class to generate and track various statistics to compare the different subset search algorithms.
     """
 
+    # The counters are updated from inside the AI's inference loop, slots make those attribute accesses direct
+    __slots__ = (
+        'grid_size',
+        'knowledge_base_total_size',
+        'knowledge_base_max_size',
+        'knowledge_base_count',
+        'inferences_total',
+        'inferences_max',
+        'subset_comparisons_total',
+        'subset_comparisons_max',
+        'subset_comparisons_count',
+        'iterations_total',
+        'iterations_max',
+        'iterations_count',
+        'duplicate_inferences_total',
+        '_stats_summary'
+    )
+
     def __init__(self, grid_size: int):
         """
         Initialize the StatGenerator with the size of the grid.
@@ -25,12 +43,15 @@ class StatGenerator:
         self.iterations_max: int = 0  # Max iterations in a single loop
         self.iterations_count: int = 0  # Count of loops
         self.duplicate_inferences_total: int = 0  # Tracking duplicate non-empty inferences
+        # The last summary built by get_performance_stats_summary, cleared whenever a statistic changes
+        self._stats_summary: Optional[Dict[str, Any]] = None
 
     def reset_current_stats(self) -> None:
         """
         Reset counters that are specific to the current operation.
         Increments the knowledge base count.
         """
+        self._stats_summary = None
         self.knowledge_base_count += 1
 
     def update_knowledge_base_size(self, size: int) -> None:
@@ -39,45 +60,34 @@ class StatGenerator:
 
         :param size: The current size of the knowledge base.
         """
+        self._stats_summary = None
         self.knowledge_base_total_size += size
         if size > self.knowledge_base_max_size:
             self.knowledge_base_max_size = size
 
-    def update_inferences(self, inferences: int) -> None:
+    def update_search_stats(self, comparisons: int, inferences: int) -> None:
         """
-        Update the total and maximum number of inferences made.
+        Update the subset comparison and inference statistics for one search of the knowledge base.
 
-        :param inferences: The number of inferences made in the current operation.
+        :param comparisons: The number of subset comparisons made in the search.
+        :param inferences: The number of inferences made in the search.
         """
+        self._stats_summary = None
+        if comparisons > self.subset_comparisons_max:
+            self.subset_comparisons_max = comparisons
+        self.subset_comparisons_total += comparisons
+        self.subset_comparisons_count += 1
         self.inferences_total += inferences
         if inferences > self.inferences_max:
             self.inferences_max = inferences
 
-    def update_total_subset_comparisons(self, comparisons: int) -> None:
-        """
-        Update the total number of subset comparisons.
-
-        :param comparisons: The number of subset comparisons made in the current operation.
-        """
-        self.subset_comparisons_total += comparisons
-        self.subset_comparisons_count += 1
-
-    def update_subset_comparisons(self, comparisons: int) -> None:
-        """
-        Update the maximum and total number of subset comparisons.
-
-        :param comparisons: The number of subset comparisons made in the current operation.
-        """
-        if comparisons > self.subset_comparisons_max:
-            self.subset_comparisons_max = comparisons
-        self.update_total_subset_comparisons(comparisons)
-
     def update_iterations(self, iterations: int) -> None:
         """
         Update the total and maximum number of iterations in loops.
 
         :param iterations: The number of iterations made in the current operation.
         """
+        self._stats_summary = None
         self.iterations_total += iterations
         if iterations > self.iterations_max:
             self.iterations_max = iterations
@@ -89,6 +99,7 @@ class StatGenerator:
 
         :param duplicates: The number of duplicate inferences made in the current operation.
         """
+        self._stats_summary = None
         self.duplicate_inferences_total += duplicates
 
     def get_inference_to_comparison_ratio(self) -> float:
@@ -115,8 +126,14 @@ class StatGenerator:
         """
         Generate a summary of the performance statistics.
 
-        :return: A dictionary containing the summary of performance statistics.
+        :return: A dictionary containing the summary of performance statistics. It is shared between
+                 calls until the statistics change, so it should not be modified.
         """
+        # The summary is requested on every frame while the stats panel is shown,
+        # so it is only rebuilt after one of the statistics has changed
+        if self._stats_summary is not None:
+            return self._stats_summary
+
         stats_summary = {
             "knowledge_base_avg_size": self.knowledge_base_total_size / self.knowledge_base_count if self.knowledge_base_count > 0 else 0,
             "knowledge_base_max_size": self.knowledge_base_max_size,
@@ -130,12 +147,14 @@ class StatGenerator:
             "iterations_total": self.iterations_total,
             "duplicate_inferences_total": self.duplicate_inferences_total
         }
+        self._stats_summary = stats_summary
         return stats_summary
 
     def reset_stats(self) -> None:
         """
         Reset all statistics to their initial values.
         """
+        self._stats_summary = None
         self.knowledge_base_total_size = 0
         self.knowledge_base_max_size = 0
         self.knowledge_base_count = 0
@@ -1,35 +1,11 @@
+import heapq
+from bisect import bisect_left, bisect_right
 from collections import deque
-from typing import List, Optional
+from typing import Callable, Deque, List, Union
 from .knowledge_statement import KnowledgeStatement
 from .stat_generator import StatGenerator
 
 
-class TreeNode:
-    """
-    Represents a node in a tree structure used in BFS and DFS search algorithms.
-    """
-
-    def __init__(self, knowledge_base: List[KnowledgeStatement], parent: Optional['TreeNode'] = None):
-        """
-        Initialize a TreeNode.
-
-        :param knowledge_base: The knowledge base (a list of KnowledgeStatement objects) at this node.
-        :param parent: The parent node in the tree.
-        """
-        self.knowledge_base: List[KnowledgeStatement] = knowledge_base
-        self.parent: Optional[TreeNode] = parent
-        self.children: List[TreeNode] = []
-        self.inferences: List[KnowledgeStatement] = []
-
-    def add_child(self, child_node: 'TreeNode') -> None:
-        """
-        Add a child node to this node.
-
-        :param child_node: The TreeNode to add as a child.
-        """
-        self.children.append(child_node)
-
-
 class SubsetSearchAlgorithms:
     """
     Contains various subset search algorithms for inferring new KnowledgeStatements from an existing knowledge base.
@@ -74,21 +50,30 @@ class SubsetSearchAlgorithms:
         :return: A list of inferred KnowledgeStatement objects.
         """
         inferred_statements: List[KnowledgeStatement] = []
-        inferred_statements_set = set()
+        # Inferences are deduplicated on their (cell mask, mine count) key, so a statement is
+        # only constructed the first time its key is seen
+        inferred_keys = set()
+
+        # Every statement is compared with every statement, so the count is known up front
+        subset_comparisons += len(knowledge_base) * len(knowledge_base)
 
         for statement in knowledge_base:
+            # Read once per statement rather than once per pair
+            statement_mask = statement.cell_mask
+            statement_cells = statement.get_cell_positions()
+            statement_mine_count = statement.get_mine_count()
+
             for other_statement in knowledge_base:
-                subset_comparisons += 1
-                if statement.get_cell_positions().issubset(other_statement.get_cell_positions()):
-                    inferred_cells = other_statement.get_cell_positions() - statement.get_cell_positions()
-                    inferred_count = other_statement.get_mine_count() - statement.get_mine_count()
-                    new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
-                    if new_inferred_statement not in inferred_statements_set:
-                        inferred_statements.append(new_inferred_statement)
-                        inferred_statements_set.add(new_inferred_statement)
+                other_mask = other_statement.cell_mask
+                if (statement_mask & other_mask) == statement_mask:
+                    inferred_count = other_statement.get_mine_count() - statement_mine_count
+                    inferred_key = (other_mask ^ statement_mask, inferred_count)
+                    if inferred_key not in inferred_keys:
+                        inferred_cells = other_statement.get_cell_positions() - statement_cells
+                        inferred_statements.append(KnowledgeStatement(inferred_cells, inferred_count))
+                        inferred_keys.add(inferred_key)
 
-        self.stat_generator.update_subset_comparisons(subset_comparisons)
-        self.stat_generator.update_inferences(len(inferred_statements))
+        self.stat_generator.update_search_stats(subset_comparisons, len(inferred_statements))
 
         return inferred_statements
 
@@ -104,37 +89,53 @@ class SubsetSearchAlgorithms:
             return []
 
         def divide_and_conquer(a_knowledge_base: List[KnowledgeStatement], start: int, end: int):
+            # Each half is returned as a list alongside a set of the (cell mask, mine count) keys of the same
+            # statements, so membership during the merge is tested against the set rather than by scanning the list
             if start > end:
-                return [], 0, 0  # Return empty list, 0 comparisons, 0 inferences
+                return [], set(), 0, 0  # Return empty list, 0 comparisons, 0 inferences
 
             if start == end:
-                return [a_knowledge_base[start]], 0, 0  # Single element, no comparisons
+                statement = a_knowledge_base[start]
+                return [statement], {(statement.cell_mask, statement.get_mine_count())}, 0, 0  # Single element, no comparisons
 
             mid = (start + end) // 2
-            left_inferred, left_comparisons, left_inferences = divide_and_conquer(a_knowledge_base, start, mid)
-            right_inferred, right_comparisons, right_inferences = divide_and_conquer(a_knowledge_base, mid + 1, end)
+            left_inferred, left_keys, left_comparisons, left_inferences = divide_and_conquer(a_knowledge_base, start, mid)
+            right_inferred, right_keys, right_comparisons, right_inferences = divide_and_conquer(a_knowledge_base, mid + 1, end)
 
             merge_statements = left_inferred + right_inferred
-            merge_comparisons = left_comparisons + right_comparisons
+            merge_keys = left_keys | right_keys
+            # Every left statement is compared with every right statement
+            merge_comparisons = left_comparisons + right_comparisons + len(left_inferred) * len(right_inferred)
             merge_inferences = left_inferences + right_inferences
 
             for left_statement in left_inferred:
+                # Read once per statement rather than once per pair
+                left_mask = left_statement.cell_mask
+
                 for right_statement in right_inferred:
-                    merge_comparisons += 1
-                    if left_statement.get_cell_positions().issubset(right_statement.get_cell_positions()):
-                        inferred_cells = right_statement.get_cell_positions() - left_statement.get_cell_positions()
-                        inferred_count = right_statement.get_mine_count() - left_statement.get_mine_count()
-                        new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
-                        if new_inferred_statement not in merge_statements:
-                            merge_statements.append(new_inferred_statement)
-                            merge_inferences += 1
+                    right_mask = right_statement.cell_mask
+                    shared_mask = left_mask & right_mask
+                    # Either half may hold the subset, so both directions are checked for each pair
+                    if shared_mask == left_mask:
+                        subset_statement, superset_statement = left_statement, right_statement
+                    elif shared_mask == right_mask:
+                        subset_statement, superset_statement = right_statement, left_statement
+                    else:
+                        continue
+
+                    inferred_count = superset_statement.get_mine_count() - subset_statement.get_mine_count()
+                    inferred_key = (left_mask ^ right_mask, inferred_count)
+                    if inferred_key not in merge_keys:
+                        inferred_cells = superset_statement.get_cell_positions() - subset_statement.get_cell_positions()
+                        merge_statements.append(KnowledgeStatement(inferred_cells, inferred_count))
+                        merge_keys.add(inferred_key)
+                        merge_inferences += 1
 
-            return merge_statements, merge_comparisons, merge_inferences
+            return merge_statements, merge_keys, merge_comparisons, merge_inferences
 
-        inferred_statements, total_comparisons, total_inferences = divide_and_conquer(knowledge_base, 0, len(knowledge_base) - 1)
+        inferred_statements, _, total_comparisons, total_inferences = divide_and_conquer(knowledge_base, 0, len(knowledge_base) - 1)
 
-        self.stat_generator.update_subset_comparisons(total_comparisons)
-        self.stat_generator.update_inferences(total_inferences)
+        self.stat_generator.update_search_stats(total_comparisons, total_inferences)
 
         return inferred_statements
 
@@ -148,10 +149,18 @@ class SubsetSearchAlgorithms:
         """
         dp_cache = set()
         inferred_statements: List[KnowledgeStatement] = []
+        # Inferences are deduplicated on their (cell mask, mine count) key, so a statement is
+        # only constructed the first time its key is seen
+        inferred_keys = set()
 
         sorted_knowledge_base = sorted(knowledge_base)
 
         for i, statement in enumerate(sorted_knowledge_base):
+            # Read once per statement rather than once per pair
+            statement_mask = statement.cell_mask
+            statement_cells = statement.get_cell_positions()
+            statement_mine_count = statement.get_mine_count()
+
             for j in range(i + 1, len(sorted_knowledge_base)):
                 other_statement = sorted_knowledge_base[j]
 
@@ -160,62 +169,87 @@ class SubsetSearchAlgorithms:
                     continue
 
                 subset_comparisons += 1
-                if statement.get_cell_positions().issubset(other_statement.get_cell_positions()):
-                    inferred_cells = other_statement.get_cell_positions() - statement.get_cell_positions()
-                    inferred_count = other_statement.get_mine_count() - statement.get_mine_count()
+                other_mask = other_statement.cell_mask
+                if (statement_mask & other_mask) == statement_mask:
+                    inferred_mask = other_mask ^ statement_mask
+                    inferred_count = other_statement.get_mine_count() - statement_mine_count
 
-                    if inferred_count < 0 or not inferred_cells:
+                    if inferred_count < 0 or not inferred_mask:
                         continue
 
-                    new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
-
                     dp_cache.add(key)
 
-                    if new_inferred_statement not in inferred_statements:
+                    inferred_key = (inferred_mask, inferred_count)
+                    if inferred_key not in inferred_keys:
+                        inferred_cells = other_statement.get_cell_positions() - statement_cells
+                        new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
                         inferred_statements.append(new_inferred_statement)
+                        inferred_keys.add(inferred_key)
 
                         if len(inferred_cells) > 1:
                             dp_cache.add((new_inferred_statement, statement))
 
-        self.stat_generator.update_subset_comparisons(subset_comparisons)
-        self.stat_generator.update_inferences(len(inferred_statements))
+        self.stat_generator.update_search_stats(subset_comparisons, len(inferred_statements))
 
         return inferred_statements
 
     def greedy_algorithm_size_search(self, knowledge_base: List[KnowledgeStatement], subset_comparisons: int = 0) -> List[KnowledgeStatement]:
         """
         Perform a greedy search based on the size of cell positions to infer new KnowledgeStatements.
+        Statements are taken smallest first, and each is compared against the smaller statements already taken,
+        since only a smaller statement can be a proper subset of it. New inferences are queued to be taken in turn.
 
         :param knowledge_base: The current knowledge base of KnowledgeStatement objects.
         :param subset_comparisons: The initial count of subset comparisons (default is 0).
         :return: A list of inferred KnowledgeStatement objects.
         """
-        inferred_statements: set = set()
-
-        sorted_knowledge_base = sorted(knowledge_base, key=lambda x: len(x.get_cell_positions()))
-
-        for i, current_statement in enumerate(sorted_knowledge_base):
-            for next_statement in sorted_knowledge_base[i + 1:]:
-                subset_comparisons += 1
-
-                if len(next_statement.get_cell_positions()) >= len(current_statement.get_cell_positions()):
-                    break
-
-                if next_statement.get_cell_positions().issubset(current_statement.get_cell_positions()):
-                    inferred_cells = current_statement.get_cell_positions() - next_statement.get_cell_positions()
-                    inferred_count = current_statement.get_mine_count() - next_statement.get_mine_count()
-                    new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
-
-                    if new_inferred_statement not in inferred_statements:
-                        inferred_statements.add(new_inferred_statement)
-                        knowledge_base.append(new_inferred_statement)
+        inferred_statements: List[KnowledgeStatement] = []
+        # Inferences are deduplicated on their (cell mask, mine count) key, so a statement is
+        # only constructed the first time its key is seen
+        inferred_keys = set()
+
+        # Statements waiting to be taken, smallest first, with a counter to keep ties in insertion order
+        pending_statements = [
+            (len(statement.get_cell_positions()), order, statement) for order, statement in enumerate(knowledge_base)
+        ]
+        heapq.heapify(pending_statements)
+        next_order = len(pending_statements)
+
+        # Statements already taken, kept sorted by size alongside their sizes so the smaller ones are a prefix
+        taken_sizes: List[int] = []
+        taken_statements: List[KnowledgeStatement] = []
+
+        while pending_statements:
+            current_size, _, current_statement = heapq.heappop(pending_statements)
+            # Read once per statement rather than once per pair
+            current_mask = current_statement.cell_mask
+            current_cells = current_statement.get_cell_positions()
+            current_mine_count = current_statement.get_mine_count()
+
+            smaller_statements = taken_statements[:bisect_left(taken_sizes, current_size)]
+            subset_comparisons += len(smaller_statements)
+
+            for smaller_statement in smaller_statements:
+                smaller_mask = smaller_statement.cell_mask
+                if (smaller_mask & current_mask) == smaller_mask:
+                    inferred_count = current_mine_count - smaller_statement.get_mine_count()
+                    inferred_key = (current_mask ^ smaller_mask, inferred_count)
+
+                    if inferred_key not in inferred_keys:
+                        inferred_cells = current_cells - smaller_statement.get_cell_positions()
+                        new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
+                        inferred_statements.append(new_inferred_statement)
+                        inferred_keys.add(inferred_key)
+                        heapq.heappush(pending_statements, (len(inferred_cells), next_order, new_inferred_statement))
+                        next_order += 1
 
-            sorted_knowledge_base = sorted(knowledge_base, key=lambda x: len(x.get_cell_positions()))
+            insert_at = bisect_right(taken_sizes, current_size)
+            taken_sizes.insert(insert_at, current_size)
+            taken_statements.insert(insert_at, current_statement)
 
-        self.stat_generator.update_subset_comparisons(subset_comparisons)
-        self.stat_generator.update_inferences(len(inferred_statements))
+        self.stat_generator.update_search_stats(subset_comparisons, len(inferred_statements))
 
-        return list(inferred_statements)
+        return inferred_statements
 
     def greedy_algorithm_minecount_search(self, knowledge_base: List[KnowledgeStatement], subset_comparisons: int = 0) -> List[KnowledgeStatement]:
         """
@@ -226,23 +260,32 @@ class SubsetSearchAlgorithms:
         :return: A list of inferred KnowledgeStatement objects.
         """
         inferred_statements: List[KnowledgeStatement] = []
+        # Inferences are deduplicated on their (cell mask, mine count) key, so a statement is
+        # only constructed the first time its key is seen
+        inferred_keys = set()
 
         sorted_knowledge_base = sorted(knowledge_base, reverse=True)
 
         for i, current_statement in enumerate(sorted_knowledge_base):
+            # Read once per statement rather than once per pair
+            current_mask = current_statement.cell_mask
+            current_cells = current_statement.get_cell_positions()
+            current_mine_count = current_statement.get_mine_count()
+
             for next_statement in sorted_knowledge_base[i + 1:]:
                 subset_comparisons += 1
-                if next_statement.get_cell_positions().issubset(current_statement.get_cell_positions()):
-                    inferred_cells = current_statement.get_cell_positions() - next_statement.get_cell_positions()
-                    inferred_count = current_statement.get_mine_count() - next_statement.get_mine_count()
-                    new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
-                    if new_inferred_statement not in inferred_statements:
-                        inferred_statements.append(new_inferred_statement)
+                next_mask = next_statement.cell_mask
+                if (next_mask & current_mask) == next_mask:
+                    inferred_count = current_mine_count - next_statement.get_mine_count()
+                    inferred_key = (current_mask ^ next_mask, inferred_count)
+                    if inferred_key not in inferred_keys:
+                        inferred_cells = current_cells - next_statement.get_cell_positions()
+                        inferred_statements.append(KnowledgeStatement(inferred_cells, inferred_count))
+                        inferred_keys.add(inferred_key)
                 else:
                     break
 
-        self.stat_generator.update_subset_comparisons(subset_comparisons)
-        self.stat_generator.update_inferences(len(inferred_statements))
+        self.stat_generator.update_search_stats(subset_comparisons, len(inferred_statements))
 
         return inferred_statements
 
@@ -250,92 +293,84 @@ class SubsetSearchAlgorithms:
         KnowledgeStatement]:
         """
         Perform a breadth-first search (BFS) to infer new KnowledgeStatements.
+        Statements are taken from a queue, so every statement of one level is compared before the inferences
+        it leads to. BFS and DFS infer the same statements with the same number of subset comparisons,
+        and differ only in the order in which the statements are visited and the inferences are returned.
 
         :param knowledge_base: The current knowledge base of KnowledgeStatement objects.
         :param subset_comparisons: The initial count of subset comparisons (default is 0).
         :return: A list of inferred KnowledgeStatement objects.
         """
         # Sort by the size of cell positions to ensure we start with smaller, simpler sets
-        sorted_knowledge_base = sorted(knowledge_base, key=lambda ks: len(ks.get_cell_positions()))
-        root = TreeNode(sorted_knowledge_base)
-        queue = deque([root])
-        inferred_statements: List[KnowledgeStatement] = []
-        visited = set()
-
-        while queue:
-            current_node = queue.popleft()
-            current_kb = current_node.knowledge_base
-            kb_key = tuple(sorted(tuple(ks.get_cell_positions()) for ks in current_kb))
-
-            if kb_key in visited:
-                continue
-            visited.add(kb_key)
-
-            # Iterate over the knowledge base statements at the current depth level
-            for i, statement in enumerate(current_kb):
-                for other_statement in current_kb[i + 1:]:
-                    subset_comparisons += 1
-                    if statement.get_cell_positions().issubset(other_statement.get_cell_positions()):
-                        inferred_cells = other_statement.get_cell_positions() - statement.get_cell_positions()
-                        inferred_count = other_statement.get_mine_count() - statement.get_mine_count()
-                        new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
-                        if new_inferred_statement not in inferred_statements:
-                            inferred_statements.append(new_inferred_statement)
-                            new_kb = current_kb + [new_inferred_statement]
-                            new_node = TreeNode(new_kb, current_node)
-                            current_node.add_child(new_node)
-                            queue.append(new_node)  # Add the node to explore in subsequent BFS levels
-
-        self.stat_generator.update_subset_comparisons(subset_comparisons)
-        self.stat_generator.update_inferences(len(inferred_statements))
-
-        return inferred_statements
+        queue = deque(sorted(knowledge_base, key=lambda ks: len(ks.get_cell_positions())))
+        return self._search_work_list(queue, queue.popleft, subset_comparisons)
 
     def dfs_search(self, knowledge_base: List[KnowledgeStatement], subset_comparisons: int = 0) -> List[
                    KnowledgeStatement]:
         """
         Perform a depth-first search (DFS) to infer new KnowledgeStatements.
+        Statements are taken from a stack, so each inference is followed up before the statements already waiting.
+        BFS and DFS infer the same statements with the same number of subset comparisons,
+        and differ only in the order in which the statements are visited and the inferences are returned.
 
         :param knowledge_base: The current knowledge base of KnowledgeStatement objects.
         :param subset_comparisons: The initial count of subset comparisons (default is 0).
         :return: A list of inferred KnowledgeStatement objects.
         """
         # Sort the knowledge base by size, prioritizing larger sets for deeper exploration
-        sorted_knowledge_base = sorted(knowledge_base, key=lambda ks: -len(ks.get_cell_positions()))
-        root = TreeNode(sorted_knowledge_base)
-        stack = [root]
+        stack = sorted(knowledge_base, key=lambda ks: -len(ks.get_cell_positions()))
+        return self._search_work_list(stack, stack.pop, subset_comparisons)
+
+    def _search_work_list(self, work_list: Union[Deque[KnowledgeStatement], List[KnowledgeStatement]],
+                          take_next: Callable[[], KnowledgeStatement],
+                          subset_comparisons: int) -> List[KnowledgeStatement]:
+        """
+        Infer new KnowledgeStatements by taking statements from a work list until it is empty.
+        Each statement taken is compared in both directions against every statement taken before it,
+        and each new inference is added to the work list to be taken in turn.
+
+        :param work_list: The statements still to be explored, new inferences are appended to it.
+        :param take_next: Removes and returns the next statement of the work list, which sets the visit order.
+        :param subset_comparisons: The initial count of subset comparisons.
+        :return: A list of inferred KnowledgeStatement objects.
+        """
+        explored_statements: List[KnowledgeStatement] = []
         inferred_statements: List[KnowledgeStatement] = []
-        visited = set()
-
-        while stack:
-            current_node = stack.pop()
-            current_kb = current_node.knowledge_base
-            kb_key = tuple(sorted(tuple(ks.get_cell_positions()) for ks in current_kb))
-
-            if kb_key in visited:
-                continue
-            visited.add(kb_key)
-
-            # Iterate over the knowledge base statements to find subsets
-            for i, statement in enumerate(current_kb):
-                for other_statement in current_kb[i + 1:]:
-                    subset_comparisons += 1
-                    if statement.get_cell_positions().issubset(other_statement.get_cell_positions()):
-                        inferred_cells = other_statement.get_cell_positions() - statement.get_cell_positions()
-                        inferred_count = other_statement.get_mine_count() - statement.get_mine_count()
-
-                        if inferred_count >= 0 and inferred_cells:  # Ensure valid and meaningful inference
-                            new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
-                            if new_inferred_statement not in inferred_statements:
-                                inferred_statements.append(new_inferred_statement)
-                                new_kb = current_kb + [new_inferred_statement]
-                                new_node = TreeNode(new_kb, current_node)
-                                current_node.add_child(new_node)
-                                stack.append(new_node)  # Continue exploring this path
-
-        self.stat_generator.update_subset_comparisons(subset_comparisons)
-        self.stat_generator.update_inferences(len(inferred_statements))
+        # Inferences are deduplicated on their (cell mask, mine count) key, so a statement is
+        # only constructed the first time its key is seen
+        inferred_keys = set()
+
+        while work_list:
+            current_statement = take_next()
+
+            current_mask = current_statement.cell_mask
+
+            # Compare against every statement explored so far, in whichever direction is a subset
+            subset_comparisons += len(explored_statements)
+            for explored_statement in explored_statements:
+                explored_mask = explored_statement.cell_mask
+                shared_mask = current_mask & explored_mask
+                if shared_mask == explored_mask:
+                    subset_statement, superset_statement = explored_statement, current_statement
+                elif shared_mask == current_mask:
+                    subset_statement, superset_statement = current_statement, explored_statement
+                else:
+                    continue
 
-        return inferred_statements
+                inferred_mask = current_mask ^ explored_mask
+                inferred_count = superset_statement.get_mine_count() - subset_statement.get_mine_count()
 
+                if inferred_count >= 0 and inferred_mask:  # Ensure valid and meaningful inference
+                    inferred_key = (inferred_mask, inferred_count)
+                    if inferred_key not in inferred_keys:
+                        inferred_cells = superset_statement.get_cell_positions() - subset_statement.get_cell_positions()
+                        new_inferred_statement = KnowledgeStatement(inferred_cells, inferred_count)
+                        inferred_statements.append(new_inferred_statement)
+                        inferred_keys.add(inferred_key)
+                        work_list.append(new_inferred_statement)  # Explored once the work list reaches it
 
+            explored_statements.append(current_statement)
+
+        self.stat_generator.update_search_stats(subset_comparisons, len(inferred_statements))
+
+        return inferred_statements
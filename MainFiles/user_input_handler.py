@@ -1,5 +1,5 @@
 import pygame
-import time
+from collections import OrderedDict
 from typing import Tuple, List, Optional
 
 
@@ -24,22 +24,43 @@ class UserInputHandler:
         self.box_colour: pygame.Color = pygame.Color('white')
 
         self.text_content: str = str(default) if default is not None else initial_text
+        # The text as a non-negative integer, or None if it is not one, parsed whenever the text changes
+        self.int_value: Optional[int] = self._parse_int_value()
 
         self.input_font: pygame.font.Font = pygame.font.Font(None, 36)
         self.rendered_text_surface: pygame.Surface = self.input_font.render(self.text_content, True, self.box_colour)
+        # Rendered text keyed by its content and colour, so retyping a value already shown reuses its surface,
+        # least recently used evicted first
+        self._rendered_text_cache: OrderedDict = OrderedDict()
+        self._rendered_text_cache_size: int = 32
+        # Where the rendered text was last centred, reused until the text or the box position changes
+        self._text_rect: Optional[pygame.Rect] = None
         self.is_active: bool = False
 
-    def handle_event(self, event: pygame.event.Event, update_board_state_func: Optional[callable] = None) -> None:
+    def handle_events(self, events: List[pygame.event.Event], update_board_state_func: Optional[callable] = None) -> None:
         """
-        Handle input events for the text box, including mouse clicks and key presses.
+        Handle a frame's input events for the text box, including mouse clicks and key presses.
 
-        :param event: The event to handle.
+        :param events: The events taken from the queue this frame.
         :param update_board_state_func: Optional callable to update board state in the UI.
         """
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self._handle_mouse_click(event)
-        elif event.type == pygame.KEYDOWN and self.is_active:
-            self._handle_key_press(event, update_board_state_func)
+        key_pressed = False
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self._handle_mouse_click(event)
+            elif event.type == pygame.KEYDOWN and self.is_active:
+                self._handle_key_press(event)
+                key_pressed = True
+
+        # Several keys pressed in one frame are applied together, so the text is rendered
+        # and the board state updated once for the frame rather than once per key
+        if key_pressed:
+            self.int_value = self._parse_int_value()
+            self.rendered_text_surface = self._render_text_content()
+            self._text_rect = None
+
+            if update_board_state_func:
+                update_board_state_func()
 
     def _handle_mouse_click(self, event: pygame.event.Event) -> None:
         """
@@ -53,12 +74,11 @@ class UserInputHandler:
             self.is_active = False
         self.box_colour = pygame.Color((230, 135, 60)) if self.is_active else pygame.Color('white')
 
-    def _handle_key_press(self, event: pygame.event.Event, update_board_state_func: Optional[callable]) -> None:
+    def _handle_key_press(self, event: pygame.event.Event) -> None:
         """
         Handle key press events for text input.
 
         :param event: The key event to handle.
-        :param update_board_state_func: Optional callable to update board state in the UI.
         """
         if event.key == pygame.K_RETURN:
             self.is_active = False
@@ -67,20 +87,36 @@ class UserInputHandler:
             self.text_content = self.text_content[:-1]
         else:
             self.text_content += event.unicode
-        self.rendered_text_surface = self.input_font.render(self.text_content, True, self.box_colour)
 
-        if update_board_state_func:
-            update_board_state_func()
+    def _render_text_content(self) -> pygame.Surface:
+        """
+        Render the current text in the box colour, reusing the surface if that text and colour were rendered before.
+
+        :return: The rendered text surface.
+        """
+        cache_key = (self.text_content, tuple(self.box_colour))
+        rendered_text = self._rendered_text_cache.get(cache_key)
+        if rendered_text is None:
+            # Converted once when first rendered, as the text is blitted on every frame the menu is shown
+            rendered_text = self.input_font.render(self.text_content, True, self.box_colour).convert_alpha()
+            self._rendered_text_cache[cache_key] = rendered_text
+            if len(self._rendered_text_cache) > self._rendered_text_cache_size:
+                self._rendered_text_cache.popitem(last=False)
+        else:
+            self._rendered_text_cache.move_to_end(cache_key)
+        return rendered_text
 
-    def draw_input_box(self, screen: pygame.Surface) -> None:
+    def draw_input_box(self, screen: pygame.Surface) -> pygame.Rect:
         """
         Draw the input box and the text on the screen.
 
         :param screen: The screen surface to draw on.
+        :return: The area of the screen drawn on, covering both the box and its text.
         """
-        text_rect = self.rendered_text_surface.get_rect(center=self.input_box_rect.center)
-        screen.blit(self.rendered_text_surface, text_rect)
-        pygame.draw.rect(screen, self.box_colour, self.input_box_rect, 2)
+        if self._text_rect is None or self._text_rect.center != self.input_box_rect.center:
+            self._text_rect = self.rendered_text_surface.get_rect(center=self.input_box_rect.center)
+        text_area = screen.blit(self.rendered_text_surface, self._text_rect)
+        return text_area.union(pygame.draw.rect(screen, self.box_colour, self.input_box_rect, 2))
 
     def get_text_content(self) -> str:
         """
@@ -90,13 +126,30 @@ class UserInputHandler:
         """
         return self.text_content
 
+    def _parse_int_value(self) -> Optional[int]:
+        """
+        Parse the current text as a non-negative integer.
+
+        :return: The integer value, or None if the text is not made up only of digits.
+        """
+        return int(self.text_content) if self.text_content.isdecimal() else None
+
+    def get_int_value(self) -> Optional[int]:
+        """
+        Return the current text as a non-negative integer.
+
+        :return: The integer value, or None if the text is not a valid integer.
+        """
+        return self.int_value
+
     def process_user_interactions(
         self,
         game_board_cells: List[List[pygame.Rect]],
         ai_button_rect: pygame.Rect,
         reset_button_rect: pygame.Rect,
         game_instance,
-        is_ai_active: bool
+        is_ai_active: bool,
+        click_position: Optional[Tuple[int, int]]
     ) -> Tuple[Optional[Tuple[int, int]], bool, bool]:
         """
         Handle user interactions with the game board and UI buttons.
@@ -106,16 +159,17 @@ class UserInputHandler:
         :param reset_button_rect: The rect for the reset button.
         :param game_instance: The game instance to interact with.
         :param is_ai_active: Whether the AI is currently playing.
+        :param click_position: Position of the left click made this frame, or None if there was none.
         :return: A tuple containing the user's move, the updated AI playing status, and whether a reset was requested.
         """
         selected_cell: Optional[Tuple[int, int]] = None
         reset_requested: bool = False
-        left_click, _, _ = pygame.mouse.get_pressed()
 
-        if left_click == 1:
-            mouse_position = pygame.mouse.get_pos()
+        # Each click is only seen on the frame its MOUSEBUTTONDOWN event arrives, so holding the
+        # mouse button down does not repeat it and no sleep is needed to debounce it
+        if click_position is not None:
             selected_cell, is_ai_active, reset_requested = self._handle_mouse_interaction(
-                mouse_position, game_board_cells, ai_button_rect, reset_button_rect, game_instance, is_ai_active
+                click_position, game_board_cells, ai_button_rect, reset_button_rect, game_instance, is_ai_active
             )
 
         return selected_cell, is_ai_active, reset_requested
@@ -144,21 +198,25 @@ class UserInputHandler:
         reset_requested: bool = False
 
         if ai_button_rect.collidepoint(mouse_position) and not game_instance.game_over:
-            time.sleep(0.5)
             is_ai_active = True  # Start AI play-through mode
 
         elif reset_button_rect.collidepoint(mouse_position):
             reset_requested = True
 
         elif not game_instance.game_over:
-            for row_index in range(game_instance.get_grid_size()):
-                for col_index in range(game_instance.get_grid_size()):
-                    cell = (row_index, col_index)
-                    if (
-                        game_board_cells[row_index][col_index].collidepoint(mouse_position) and
-                        cell not in game_instance.flagged_mine_positions and
-                        cell not in game_instance.revealed_positions
-                    ):
-                        selected_cell = cell
+            # The cells form a uniform grid, so the clicked cell is found from the first cell's
+            # position and size rather than by testing every cell on the board
+            first_cell = game_board_cells[0][0]
+            row_index = (mouse_position[1] - first_cell.y) // first_cell.height
+            col_index = (mouse_position[0] - first_cell.x) // first_cell.width
+            grid_size = game_instance.get_grid_size()
+            if 0 <= row_index < grid_size and 0 <= col_index < grid_size:
+                cell = (row_index, col_index)
+                if (
+                    game_board_cells[row_index][col_index].collidepoint(mouse_position) and
+                    cell not in game_instance.flagged_mine_positions and
+                    cell not in game_instance.revealed_positions
+                ):
+                    selected_cell = cell
 
         return selected_cell, is_ai_active, reset_requested
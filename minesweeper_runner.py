@@ -1,11 +1,26 @@
 import pygame
 import sys
-import time
 from typing import Tuple, Optional, List
 from MainFiles.minesweeper_game import MinesweeperGame
 from MainFiles.minesweeper_ai import MinesweeperAI
 from MainFiles.minesweeper_ui import MinesweeperUI
 
+# Seconds between AI moves for each speed option
+AI_MOVE_SPEEDS = {'Click per turn': 0.5, 'Normal': 0.4, 'Fastest': 0.0001}
+
+# The only event types the game reads; everything else, such as mouse motion, is kept out of the queue.
+# Expose events arrive when a covered or minimised window is shown again and its contents must be redrawn
+WINDOW_EXPOSE_EVENT_TYPES = [pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+HANDLED_EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN] + WINDOW_EXPOSE_EVENT_TYPES
+
+# The start position type passed to MinesweeperGame for each start position option
+START_POSITION_TYPES = {
+    'First cell': 'first',
+    'Centre cell': 'centre',
+    'Last cell': 'last',
+    'Random cell': 'random'
+}
+
 
 class MinesweeperRunner:
     """
@@ -21,8 +36,13 @@ class MinesweeperRunner:
         self.current_game = initial_game
         self.user_interface = MinesweeperUI(self.current_game)
 
-        selected_algorithm_name = self.user_interface.search_algorithms[self.user_interface.current_algorithm_index].strip()
-        selected_safe_cell_strategy = self.user_interface.safe_cell_strategies[self.user_interface.current_safe_cell_strategy_index].strip()
+        # Block every event type, then allow back only the ones handled, so the main loop
+        # is not handed a stream of events it would discard
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
+
+        selected_algorithm_name = self.user_interface.current_search_algorithm_name.strip()
+        selected_safe_cell_strategy = self.user_interface.current_safe_cell_strategy_name.strip()
 
         self.ai_controller = MinesweeperAI(
             grid_size=self.current_game.get_grid_size(),
@@ -35,6 +55,29 @@ class MinesweeperRunner:
         self.manual_move_mode: bool = False  # Click per turn boolean flag.
         self.saved_board_layout: Optional[List[List[bool]]] = None  # Store the saved board layout
 
+        # Whether anything on screen may have changed since the display was last updated, so frames
+        # where nothing has changed skip drawing and updating the display
+        self.screen_changed: bool = True
+        # Whether the next game screen frame must update the whole display, after the screen was cleared for a new
+        # game or the window's contents were lost; otherwise only the areas that were drawn are updated
+        self.whole_display_changed: bool = True
+        # Set at the end of a frame when nothing will change until the user does something, so the next
+        # frame sleeps until an event arrives rather than redrawing an unchanged screen
+        self.waiting_for_input: bool = False
+        # Longest the loop sleeps while waiting for input, in milliseconds
+        self.idle_wait_timeout_ms: int = 100
+        # When the AI playing on its own may make its next move, in pygame ticks, so the move speed is kept
+        # without sleeping and events are still handled in between moves
+        self.next_ai_move_at_ms: int = 0
+        # While the AI plays on its own the stats change on every move, faster than they can be read, so
+        # the stats panel is redrawn at most this often, in milliseconds, and otherwise left as last drawn
+        self.stats_panel_interval_ms: int = 200
+        self.next_stats_panel_draw_at_ms: int = 0
+        # The remaining safe move count, with the AI and set sizes it was counted from. Both sets only grow
+        # during a game, so the count is only taken again once the AI has found or played another safe cell
+        self._safe_moves_count_key: Optional[Tuple[MinesweeperAI, int, int]] = None
+        self._safe_moves_count: int = 0
+
         # Track the last corner and edge for reuse when board state is "Existing"
         self.last_corner: Optional[Tuple[int, int]] = None
         self.last_edge: Optional[Tuple[int, int]] = None
@@ -46,17 +89,15 @@ class MinesweeperRunner:
         Generates a new board and starts a fresh game.
         """
         try:
-            board_size_text = self.user_interface.board_size_input['box'].get_text_content()
-            mine_percentage_text = self.user_interface.mines_input['box'].get_text_content()
+            # Parsed by the input boxes as the text was typed
+            board_size: Optional[int] = self.user_interface.board_size_input['box'].get_int_value()
+            mine_percentage: Optional[int] = self.user_interface.mines_input['box'].get_int_value()
 
-            if not board_size_text.isdigit() or not mine_percentage_text.isdigit():
+            if board_size is None or mine_percentage is None:
                 self.user_interface.error_message = \
                     "Please enter valid positive integers for board size and percentage of mines."
                 return
 
-            board_size: int = int(board_size_text)
-            mine_percentage: int = int(mine_percentage_text)
-
             if board_size <= 0 or mine_percentage < 0 or mine_percentage > 100:
                 self.user_interface.error_message = \
                     "Board size must be greater than zero and percentage of mines must be between 0 and 100."
@@ -69,22 +110,12 @@ class MinesweeperRunner:
                 self.user_interface.error_message = "The calculated number of mines must be greater than zero."
                 return
 
-            speed_mapping = {'Click per turn': 0.5, 'Normal': 0.4, 'Fastest': 0.0001}
-            selected_speed = self.user_interface.speed_options[self.user_interface.current_speed_index]
-            ai_move_speed: float = speed_mapping[selected_speed]
-
-            selected_algorithm = self.user_interface.search_algorithms[self.user_interface.current_algorithm_index]
-            selected_safe_cell_strategy = self.user_interface.safe_cell_strategies[self.user_interface.current_safe_cell_strategy_index].strip()
+            ai_move_speed: float = AI_MOVE_SPEEDS[self.user_interface.current_speed_name]
 
-            start_position_mapping = {
-                'First cell': 'corner',
-                'Centre cell': 'centre',
-                'Last cell': 'last',
-                'Random cell': 'random'
-            }
+            selected_algorithm = self.user_interface.current_search_algorithm_name
+            selected_safe_cell_strategy = self.user_interface.current_safe_cell_strategy_name.strip()
 
-            start_position_type_ui = self.user_interface.start_position_options[self.user_interface.current_start_position_index]
-            start_position_type = start_position_mapping.get(start_position_type_ui, 'random')
+            start_position_type = START_POSITION_TYPES.get(self.user_interface.current_start_position_name, 'random')
 
             # Clear the previous saved board layout
             self.saved_board_layout = None
@@ -105,6 +136,7 @@ class MinesweeperRunner:
 
             self.update_manual_move_mode()
             self.user_interface.game.get_screen().fill(self.user_interface.get_background_colour())
+            self.whole_display_changed = True
 
         except ValueError:
             self.user_interface.error_message = "An unexpected error occurred. Please try again."
@@ -119,22 +151,12 @@ class MinesweeperRunner:
 
         try:
             board_size = len(self.saved_board_layout)
-            speed_mapping = {'Click per turn': 0.5, 'Normal': 0.4, 'Fastest': 0.0001}
-            selected_speed = self.user_interface.speed_options[self.user_interface.current_speed_index]
-            ai_move_speed: float = speed_mapping[selected_speed]
+            ai_move_speed: float = AI_MOVE_SPEEDS[self.user_interface.current_speed_name]
 
-            selected_algorithm = self.user_interface.search_algorithms[self.user_interface.current_algorithm_index]
-            selected_safe_cell_strategy = self.user_interface.safe_cell_strategies[self.user_interface.current_safe_cell_strategy_index].strip()
+            selected_algorithm = self.user_interface.current_search_algorithm_name
+            selected_safe_cell_strategy = self.user_interface.current_safe_cell_strategy_name.strip()
 
-            start_position_mapping = {
-                'First cell': 'first',
-                'Centre cell': 'centre',
-                'Last cell': 'last',
-                'Random cell': 'random'
-            }
-
-            start_position_type_ui = self.user_interface.start_position_options[self.user_interface.current_start_position_index]
-            start_position_type = start_position_mapping.get(start_position_type_ui, 'random')
+            start_position_type = START_POSITION_TYPES.get(self.user_interface.current_start_position_name, 'random')
 
             self.current_game = MinesweeperGame(grid_size=board_size, mine_count=self.current_game.get_mine_count(),
                                                 ai_move_speed=ai_move_speed,
@@ -151,6 +173,7 @@ class MinesweeperRunner:
 
             self.update_manual_move_mode()
             self.user_interface.game.get_screen().fill(self.user_interface.get_background_colour())
+            self.whole_display_changed = True
 
         except ValueError:
             self.user_interface.error_message = "An unexpected error occurred. Please try again."
@@ -177,6 +200,8 @@ class MinesweeperRunner:
 
         :param cell_position: A tuple representing the cell coordinates for the move.
         """
+        self.screen_changed = True
+
         if self.current_game.is_first_move:
             # Force the first move to be at the starting position
             cell_position = self.current_game.starting_position
@@ -184,66 +209,45 @@ class MinesweeperRunner:
 
         if cell_position:
             if self.current_game.contains_mine(cell_position):
-                self.current_game.flagged_mine_positions.add(cell_position)
+                self.current_game.flag_mine(cell_position)
                 self.ai_controller.mark_cell_as_mine(cell_position)
-                self.current_game.flagged_mine_positions.add(cell_position)
                 self.current_game.game_over = True
             else:
                 adjacent_mines_count = self.current_game.count_adjacent_mines(cell_position)
-                self.current_game.revealed_positions.add(cell_position)
+                self.current_game.reveal_cell(cell_position)
                 self.ai_controller.add_knowledge(cell_position, adjacent_mines_count)
                 self.update_flagged_positions_from_ai()
 
-    def refresh_screen(self) -> None:
-        """
-        Updates the screen to reflect the current game state.
-        """
-        self.current_game.refresh_game_screen()
-        self.user_interface.draw_game_control_buttons()
-        pygame.display.flip()
-
     def update_flagged_positions_from_ai(self) -> None:
         """
         Updates the flagged cells on the board based on the AI's knowledge of mines.
         """
-        for mine_position in self.ai_controller.identified_mines:
-            if mine_position not in self.current_game.flagged_mine_positions:
-                self.current_game.flagged_mine_positions.add(mine_position)
+        self.current_game.flag_mines(self.ai_controller.get_identified_mines())
+        self.screen_changed = True
 
     def display_options_menu(self) -> None:
         """
         Opens the options menu to allow the user to modify game settings.
         """
-        self.user_interface.options_menu_open = True
+        self.user_interface.open_options_menu()
 
         # Update the board state if the options menu was opened via the Options button
         if self.opened_via_options_button:
             # If there is a saved board layout, default to "Existing", otherwise "New"
-            if self.saved_board_layout:
-                self.user_interface.current_board_state = "Existing"
-            else:
-                self.user_interface.current_board_state = "New"
-
-            # Update the button text accordingly
-            self.user_interface.board_state_button['text'] = self.user_interface.load_font('ui_font', 28).render(
-                self.user_interface.current_board_state, True, self.user_interface.get_text_colour_1()
-            )
-            self.user_interface.board_state_button['text_rect'] = self.user_interface.board_state_button[
-                'text'].get_rect(
-                center=self.user_interface.board_state_button['rect'].center
-            )
+            # and update the button text accordingly
+            self.user_interface.set_board_state("Existing" if self.saved_board_layout else "New")
         else:
             # Ensure board state is "New" when first initialized
             self.user_interface.current_board_state = "New"
 
-        self.refresh_screen()
+        # The menu covers the whole screen, so it is drawn on the next frame without redrawing the board first
+        self.screen_changed = True
 
     def update_manual_move_mode(self) -> None:
         """
         Updates the manual_move_mode flag based on the current speed option.
         """
-        selected_speed = self.user_interface.speed_options[self.user_interface.current_speed_index]
-        self.manual_move_mode = (selected_speed == 'Click per turn')
+        self.manual_move_mode = (self.user_interface.current_speed_name == 'Click per turn')
 
     def get_game_stats(self) -> dict:
         """
@@ -251,96 +255,184 @@ class MinesweeperRunner:
 
         :return: A dictionary containing the game statistics.
         """
-        safe_moves_set = set(self.ai_controller.identified_safe_cells)
+        # The safe cell queue can hold cells already played, so the remaining safe moves are counted from the sets
+        safe_moves_count_key = (
+            self.ai_controller, len(self.ai_controller.identified_safe_cells), len(self.ai_controller.moves_made)
+        )
+        if safe_moves_count_key != self._safe_moves_count_key:
+            self._safe_moves_count = len(self.ai_controller.identified_safe_cells - self.ai_controller.moves_made)
+            self._safe_moves_count_key = safe_moves_count_key
 
         return {
             "Board size": f"{self.current_game.get_grid_size()}x{self.current_game.get_grid_size()}",
             "Mines remaining": self.current_game.get_mine_count() - len(self.current_game.flagged_mine_positions),
             "Known mines": len(self.ai_controller.identified_mines),
-            "Safe moves": len(safe_moves_set - self.ai_controller.moves_made)
+            "Safe moves": self._safe_moves_count
         }
 
     # ---------- Main Game Loop ----------
 
-    def execute(self) -> None:
+    def get_frame_events(self) -> List[pygame.event.Event]:
         """
-        Runs the main game loop.
+        Takes this frame's events from the queue. If the game is waiting for input, or for the AI's next move
+        to be due, it first sleeps until an event arrives or that wait is over.
+
+        :return: The events to handle this frame, which may be empty.
         """
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    sys.exit()
-                self.user_interface.board_size_input['box'].handle_event(event,
-                                                                         self.user_interface.update_board_state_to_new)
-                self.user_interface.mines_input['box'].handle_event(event,
-                                                                    self.user_interface.update_board_state_to_new)
-
-            if self.user_interface.options_menu_open:
-                self.user_interface.handle_speed_button_click()
-                self.user_interface.handle_search_algorithm_button_click()
-                self.user_interface.handle_safe_cell_strategy_button_click()
-                self.user_interface.handle_start_position_button_click()
-                self.user_interface.handle_performance_stats_button_click()
-                self.user_interface.handle_inference_logic_button_click()
-                self.user_interface.handle_board_state_button_click()
-
-                if self.user_interface.handle_button_click(self.user_interface.play_button):
-                    if self.user_interface.get_current_board_state() == "New":
-                        self.initialise_new_game()
-                    else:
-                        self.initialise_existing_game()
-                    pygame.time.wait(200)
-                    pygame.event.clear(pygame.MOUSEBUTTONDOWN)
-                else:
-                    self.user_interface.display_options_menu()
-                continue
+        if self.waiting_for_input:
+            wait_ms = self.idle_wait_timeout_ms
+        elif self.is_ai_playing and not self.manual_move_mode:
+            wait_ms = self.next_ai_move_at_ms - pygame.time.get_ticks()
+        else:
+            wait_ms = 0
+        self.waiting_for_input = False
 
-            board_cells = self.current_game.draw_game_board()
-            restart_button_rect, ai_button_rect, options_button_rect = self.user_interface.draw_game_control_buttons()
+        if wait_ms <= 0:
+            return pygame.event.get()
 
-            selected_move, ai_active, restart_requested = \
-                self.user_interface.board_size_input['box'].process_user_interactions(
-                    board_cells, ai_button_rect, restart_button_rect, self.current_game, self.is_ai_playing
-                )
+        first_event = pygame.event.wait(wait_ms)
+        if first_event.type == pygame.NOEVENT:
+            return []
+        return [first_event] + pygame.event.get()
 
-            self.is_ai_playing = ai_active
+    def resolve_game_screen_clicks(self) -> Tuple[Optional[Tuple[int, int]], bool]:
+        """
+        Acts on this frame's click on the game screen, before the AI moves or anything is drawn,
+        so a click takes effect on the frame it arrives.
 
-            if restart_requested or self.user_interface.handle_button_click(self.user_interface.reset_button):
-                if self.saved_board_layout:
-                    self.reset_with_existing_board()
-                else:
-                    self.reset_with_new_board()
-                continue
+        :return: A tuple of the move selected by the click, if any, and whether the click reset the game
+                 or opened the options menu, in which case the rest of the frame is skipped.
+        """
+        ui = self.user_interface
+        selected_move, ai_active, restart_requested = \
+            ui.board_size_input['box'].process_user_interactions(
+                self.current_game.get_cell_rectangles(), ui.start_button.rect,
+                ui.reset_button.rect, self.current_game, self.is_ai_playing,
+                ui.get_click_position()
+            )
 
-            if self.user_interface.handle_button_click(self.user_interface.options_button):
-                self.opened_via_options_button = True
-                self.display_options_menu()
-                continue
+        self.is_ai_playing = ai_active
 
-            if self.manual_move_mode and self.user_interface.handle_button_click(self.user_interface.start_button):
-                selected_move = self.ai_controller.make_safe_move() or self.ai_controller.make_random_move()
+        if restart_requested or ui.handle_button_click(ui.reset_button):
+            if self.saved_board_layout:
+                self.reset_with_existing_board()
+            else:
+                self.reset_with_new_board()
+            return None, True
 
-            if self.is_ai_playing and not self.current_game.game_over:
-                if not self.manual_move_mode:
-                    selected_move = self.ai_controller.make_safe_move() or self.ai_controller.make_random_move()
+        if ui.handle_button_click(ui.options_button):
+            self.opened_via_options_button = True
+            self.display_options_menu()
+            return None, True
 
-                if not selected_move:
-                    self.current_game.flagged_mine_positions = self.ai_controller.identified_mines.copy()
-                    self.is_ai_playing = False
+        if self.manual_move_mode and ui.handle_button_click(ui.start_button):
+            selected_move = self.ai_controller.pick_move()
 
-                if selected_move:
-                    self.process_move(selected_move)
-                    time.sleep(self.current_game.get_ai_move_speed())
+        return selected_move, False
 
-            if self.user_interface.display_performance_stats:
-                performance_stats = self.ai_controller.stat_generator.get_performance_stats_summary()
-                game_stats = self.get_game_stats()
-                self.user_interface.draw_performance_stats_panel(performance_stats, game_stats)
+    def step_ai(self, selected_move: Optional[Tuple[int, int]]) -> None:
+        """
+        Makes the AI's move for this frame, if it is playing and its next move is due.
 
-            if self.current_game.is_game_won():
+        :param selected_move: The move selected by this frame's click, if any.
+        """
+        # In click per turn mode the clicks set the pace, otherwise the AI waits until its next move is due
+        ai_move_due = self.manual_move_mode or pygame.time.get_ticks() >= self.next_ai_move_at_ms
+
+        if self.is_ai_playing and not self.current_game.game_over and ai_move_due:
+            if not self.manual_move_mode:
+                selected_move = self.ai_controller.pick_move()
+
+            if not selected_move:
+                self.update_flagged_positions_from_ai()
                 self.is_ai_playing = False
 
+            if selected_move:
+                self.process_move(selected_move)
+                self.next_ai_move_at_ms = \
+                    pygame.time.get_ticks() + int(self.current_game.get_ai_move_speed() * 1000)
+
+        if self.current_game.is_game_won():
+            self.is_ai_playing = False
+
+    def render_game_screen(self) -> None:
+        """
+        Draws the board, the control buttons and the stats panel, and shows them on the display.
+        """
+        dirty_rects = self.current_game.draw_game_board()
+        dirty_rects.extend(self.user_interface.draw_game_control_buttons())
+
+        if self.user_interface.display_performance_stats:
+            now_ms = pygame.time.get_ticks()
+            ai_playing_alone = self.is_ai_playing and not self.manual_move_mode and not self.current_game.game_over
+            # Once the AI stops, the panel is drawn straight away so it shows the final stats
+            if not ai_playing_alone or now_ms >= self.next_stats_panel_draw_at_ms:
+                performance_stats = self.ai_controller.stat_generator.get_performance_stats_summary()
+                game_stats = self.get_game_stats()
+                dirty_rects.append(self.user_interface.draw_performance_stats_panel(performance_stats, game_stats))
+                self.next_stats_panel_draw_at_ms = now_ms + self.stats_panel_interval_ms
+
+        # Between moves only a few cells, the buttons and the stats panel change, so only those areas are updated
+        if self.whole_display_changed:
             pygame.display.flip()
+            self.whole_display_changed = False
+        else:
+            pygame.display.update(dirty_rects)
+
+    def execute(self) -> None:
+        """
+        Runs the main game loop.
+        """
+        # The UI lives as long as the runner, so it is bound once; the game and AI are replaced on
+        # every new game, so they are still read from self
+        ui = self.user_interface
+        board_size_box = ui.board_size_input['box']
+        mines_box = ui.mines_input['box']
+
+        while True:
+            ui.clear_click()
+            events = self.get_frame_events()
+            if any(event.type == pygame.QUIT for event in events):
+                sys.exit()
+            if events:
+                # Any click or key press can change what is shown
+                self.screen_changed = True
+                # A window shown again after being covered or minimised has lost its contents, so the
+                # next frame updates the whole display, including the parts of the menu that have not changed
+                if any(event.type in WINDOW_EXPOSE_EVENT_TYPES for event in events):
+                    ui.redraw_whole_display()
+                    self.whole_display_changed = True
+            ui.handle_events(events)
+            board_size_box.handle_events(events, ui.update_board_state_to_new)
+            mines_box.handle_events(events, ui.update_board_state_to_new)
+
+            if ui.options_menu_open:
+                ui.handle_options_menu_clicks()
+
+                if ui.handle_button_click(ui.play_button):
+                    if ui.get_current_board_state() == "New":
+                        self.initialise_new_game()
+                    else:
+                        self.initialise_existing_game()
+                else:
+                    if self.screen_changed:
+                        ui.display_options_menu()
+                        self.screen_changed = False
+                    # The menu only changes in response to the user
+                    self.waiting_for_input = True
+                continue
+
+            selected_move, screen_changed = self.resolve_game_screen_clicks()
+            if screen_changed:
+                continue
+
+            self.step_ai(selected_move)
+            if self.screen_changed:
+                self.render_game_screen()
+                self.screen_changed = False
+
+            # While the AI is playing on its own, its move speed sets the pace instead
+            self.waiting_for_input = not self.is_ai_playing or self.manual_move_mode or self.current_game.game_over
 
 
 if __name__ == "__main__":